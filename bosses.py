@@ -1,6 +1,9 @@
 """
 Módulo de chefes (bosses) para um jogo em Pygame.
 
+Funções:
+- step_towards: passo de perseguição + knockback em floats puros (núcleo do movimento).
+
 Classes:
 - BossBase: base com HP, colisão, movimento e knockback.
 - BossCharger: investida rápida com dano por contato.
@@ -17,17 +20,64 @@ O parâmetro `game` esperado em update() deve expor:
 """
 
 import pygame
-import math
+from math import cos as _cos, sin as _sin, atan2 as _atan2, pi as _pi, sqrt as _sqrt
 import random
 from constants import *
 from typing import Optional
 from enemy import Enemy
-from bullets import BossBullet, SplitterBullet
+from bullets import BossBullet, SplitterBullet, bullet_pool, draw_all as draw_bullets
+import sprite_cache
+
+# Estados de investida (Charger/Splitter); inteiros para comparação/indexação baratas
+STATE_IDLE = 0
+STATE_CHARGING = 1
+
+# Pontos fixos de teleporte (cantos e meio das bordas superior/inferior)
+TELEPORT_SPOTS = (
+    (100, 100), (SCREEN_W-100, 100),
+    (100, SCREEN_H-100), (SCREEN_W-100, SCREEN_H-100),
+    (SCREEN_W//2, 100), (SCREEN_W//2, SCREEN_H-100),
+)
+
+# Rect reutilizado para validar a posição de cada minion invocado
+_minion_rect = pygame.Rect(0, 0, ENEMY_SIZE, ENEMY_SIZE)
+
+
+def step_towards(x: float, y: float, px: float, py: float, speed: float, dt: float,
+                 kx: float, ky: float, decay: float):
+    """
+    Núcleo numérico do movimento dos bosses: um passo em direção a (px, py) somado ao
+    knockback, que é amortecido. Trabalha só com floats (sem pygame), isolando o trecho
+    quente do frame das checagens de colisão.
+
+    Args:
+        x, y (float): posição atual.
+        px, py (float): alvo (normalmente o player).
+        speed (float): velocidade escalar (negativa para se afastar).
+        dt (float): delta de tempo do frame.
+        kx, ky (float): knockback atual.
+        decay (float): taxa de amortecimento do knockback.
+
+    Returns:
+        tuple[float, float, float, float] | None: (novo_x, novo_y, novo_kx, novo_ky),
+        ou None se já estiver sobre o alvo.
+    """
+    dx = px - x
+    dy = py - y
+    d2 = dx*dx + dy*dy
+    if d2 <= 0.0:
+        return None
+    # Passo único: direção normalizada * velocidade + knockback, e decaimento do knockback
+    inv = speed * dt / _sqrt(d2)
+    decay_k = 1.0 - decay * dt
+    return x + dx*inv + kx*dt, y + dy*inv + ky*dt, kx*decay_k, ky*decay_k
 
 
 class BossBase:
     """Classe base para bosses: vida, retângulo de colisão, movimento básico e knockback."""
 
+    is_splitter = False  # só o chefe final encerra o jogo ao morrer
+
     def __init__(self, x: float, y: float, size: int, hp: int, color=(255, 255, 255)):
         """
         Inicializa o boss base.
@@ -45,11 +95,14 @@ class BossBase:
         self.hp = hp
         self.color = color
         self.rect = pygame.Rect(int(x - size//2), int(y - size//2), size, size)
+        self._scratch = pygame.Rect(0, 0, size, size)  # rect reutilizado nos testes de colisão
+        self._half = size // 2  # posiciona rects via x/y direto, sem o setter de .center
         self.speed = 120
         self.knockback_x = 0.0
         self.knockback_y = 0.0
         self.knockback_decay = 5.0
         self.is_dead_flag = False
+        self._valid_spots = None  # TELEPORT_SPOTS livres de paredes, calculados no 1º teleporte
 
     def take_damage(self, dmg: int, angle: Optional[float] = None):
         """
@@ -63,8 +116,8 @@ class BossBase:
             return
         self.hp = max(0, self.hp - dmg)
         if angle is not None:
-            self.knockback_x = math.cos(angle) * 200
-            self.knockback_y = math.sin(angle) * 200
+            self.knockback_x = _cos(angle) * 200
+            self.knockback_y = _sin(angle) * 200
         if self.hp <= 0:
             self.is_dead_flag = True
 
@@ -84,29 +137,97 @@ class BossBase:
         """
         if speed is None:
             speed = self.speed
-        dx = player.x - self.x
-        dy = player.y - self.y
-        dist = math.hypot(dx, dy)
-        if dist > 0:
-            dx = (dx / dist) * speed * dt
-            dy = (dy / dist) * speed * dt
-
-            dx += self.knockback_x * dt
-            dy += self.knockback_y * dt
-            self.knockback_x -= self.knockback_x * self.knockback_decay * dt
-            self.knockback_y -= self.knockback_y * self.knockback_decay * dt
-
-            new_x = self.x + dx
-            new_y = self.y + dy
-            new_rect = pygame.Rect(int(new_x - self.size//2), int(new_y - self.size//2), self.size, self.size)
-            if not any(new_rect.colliderect(w) for w in walls):
+        step = step_towards(self.x, self.y, player.x, player.y, speed, dt,
+                            self.knockback_x, self.knockback_y, self.knockback_decay)
+        if step is not None:
+            new_x, new_y, self.knockback_x, self.knockback_y = step
+            new_rect = self._scratch
+            new_rect.x = int(new_x) - self._half
+            new_rect.y = int(new_y) - self._half
+            if new_rect.collidelist(walls) == -1:
                 self.x, self.y = new_x, new_y
-                self.rect.center = (int(self.x), int(self.y))
+                self.rect.x = int(self.x) - self._half
+                self.rect.y = int(self.y) - self._half
+
+    def _teleport(self, walls):
+        """
+        Teleporta para um dos TELEPORT_SPOTS que não colidem com paredes.
+
+        As paredes são estáticas, então a filtragem dos pontos válidos é feita
+        uma única vez; os teleportes seguintes só sorteiam um ponto da lista.
+        """
+        if self._valid_spots is None:
+            half = self._half
+            self._valid_spots = [
+                (tx, ty) for tx, ty in TELEPORT_SPOTS
+                if pygame.Rect(tx - half, ty - half, self.size, self.size).collidelist(walls) == -1
+            ]
+        if self._valid_spots:
+            self.x, self.y = random.choice(self._valid_spots)
+            self.rect.x = int(self.x) - self._half
+            self.rect.y = int(self.y) - self._half
 
     def update(self, dt: float, game):
-        """Hook para lógica por frame; classes filhas sobrescrevem."""
+        """
+        Hook para lógica por frame; classes filhas sobrescrevem.
+
+        As filhas leem `game.player` e `game.walls` uma única vez no início do
+        update e repassam esses valores aos métodos auxiliares do frame (ticks de
+        estado, movimento, teleporte e balas).
+        """
         pass
 
+    def _update_bullets(self, dt: float, player, walls):
+        """
+        Avança as balas do boss e reconstrói `self.bullets` numa única passada.
+
+        Toda bala segue o contrato `update(dt, walls) -> (vivo, filhas)`: balas que
+        acertam o player causam dano e somem; balas mortas são trocadas pelas filhas
+        (se houver divisão). Balas que saem de jogo voltam ao `bullet_pool`.
+        """
+        # Operandos constantes no frame ficam em locais durante a varredura
+        player_rect = player.rect
+        hit_player = player.take_damage
+        release = bullet_pool.release
+        survivors = []
+        for b in self.bullets:
+            alive, split_bullets = b.update(dt, walls)
+            if alive and b.rect.colliderect(player_rect):
+                hit_player(b.damage)
+                release(b)
+                continue
+            if alive:
+                survivors.append(b)
+                continue
+            release(b)
+            if split_bullets:
+                survivors.extend(split_bullets)
+        self.bullets = survivors
+
+    def _summon_minions(self, game, walls):
+        """
+        Invoca até `minions_per_cast` minions em posições aleatórias (±120 px) ao redor do boss.
+
+        Sorteia todas as posições candidatas de uma vez e valida cada uma contra as
+        paredes com o mesmo rect reutilizado; candidatas bloqueadas são descartadas.
+        """
+        randint = random.randint
+        cx, cy = self.x, self.y
+        candidates = [(int(cx + randint(-120, 120)), int(cy + randint(-120, 120)))
+                      for _ in range(self.minions_per_cast)]
+        probe = _minion_rect
+        wave = max(1, game.current_wave)
+        spawned = []
+        for ex, ey in candidates:
+            probe.center = (ex, ey)
+            if probe.collidelist(walls) == -1:
+                spawned.append(Enemy(ex, ey, wave=wave))
+        game.enemies.extend(spawned)
+
+    def _topleft(self):
+        """Canto superior esquerdo de um sprite (size x size) centrado no boss, sem alocar Rect."""
+        return int(self.x) - self._half, int(self.y) - self._half
+
     def draw(self, screen):
         """Desenha um círculo fallback se não existir sprite específico."""
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size//2)
@@ -126,17 +247,15 @@ class BossCharger(BossBase):
         self.charge_cd = 2.8
         self.charge_timer = 0.0
         self.charge_dir = (0.0, 0.0)
-        self.state = "idle"
+        self.state = STATE_IDLE
         self._cd = 1.2
         self.contact_damage = 30
         self.knockback_power = 1200
         
         # Carregar imagens
-        self.idle_image = pygame.image.load("chargeridle.png").convert_alpha()
-        self.idle_image = pygame.transform.smoothscale(self.idle_image, (self.size, self.size))
+        self.idle_image = sprite_cache.get("chargeridle.png", self.size)
         
-        self.charging_image = pygame.image.load("chargercharging.png").convert_alpha()
-        self.charging_image = pygame.transform.smoothscale(self.charging_image, (self.size, self.size))
+        self.charging_image = sprite_cache.get("chargercharging.png", self.size)
 
     def update(self, dt, game):
         """
@@ -145,59 +264,62 @@ class BossCharger(BossBase):
         if self.is_dead_flag:
             return
 
+        player = game.player
+        walls = game.walls
+
         self._cd -= dt
-        if self.state == "charging":
+        if self.state == STATE_CHARGING:
             self.charge_timer -= dt
 
-            vx = self.charge_dir[0] * self.charge_speed * dt
-            vy = self.charge_dir[1] * self.charge_speed * dt
-            new_x = self.x + vx
-            new_y = self.y + vy
-            new_rect = pygame.Rect(int(new_x - self.size//2), int(new_y - self.size//2), self.size, self.size)
+            cdx, cdy = self.charge_dir
+            step = self.charge_speed * dt
+            new_x = self.x + cdx * step
+            new_y = self.y + cdy * step
+            new_rect = self._scratch
+            new_rect.x = int(new_x) - self._half
+            new_rect.y = int(new_y) - self._half
 
-            if any(new_rect.colliderect(w) for w in game.walls):
-                self.state = "idle"
+            if new_rect.collidelist(walls) != -1:
+                self.state = STATE_IDLE
                 self._cd = self.charge_cd
             else:
                 self.x, self.y = new_x, new_y
-                self.rect.center = (int(self.x), int(self.y))
+                self.rect.x = int(self.x) - self._half
+                self.rect.y = int(self.y) - self._half
 
-                if self.rect.colliderect(game.player.rect):
-                    kx = self.charge_dir[0] * self.knockback_power
-                    ky = self.charge_dir[1] * self.knockback_power
-                    game.player.apply_impulse(kx, ky)
-                    game.player.take_damage(self.contact_damage)
+                if self.rect.colliderect(player.rect):
+                    power = self.knockback_power
+                    player.apply_impulse(cdx * power, cdy * power)
+                    player.take_damage(self.contact_damage)
 
-                    self.state = "idle"
+                    self.state = STATE_IDLE
                     self._cd = self.charge_cd
                     self.charge_timer = 0.0
 
-            if self.charge_timer <= 0 and self.state == "charging":
-                self.state = "idle"
+            if self.charge_timer <= 0 and self.state == STATE_CHARGING:
+                self.state = STATE_IDLE
                 self._cd = self.charge_cd
 
         else:
-            self.move_towards_player(dt, game.player, game.walls, speed=self.speed)
+            self.move_towards_player(dt, player, walls, speed=self.speed)
 
             if self._cd <= 0:
-                dx = game.player.x - self.x
-                dy = game.player.y - self.y
-                d = math.hypot(dx, dy) or 1.0
-                self.charge_dir = (dx / d, dy / d)
-                self.state = "charging"
+                dx = player.x - self.x
+                dy = player.y - self.y
+                inv = 1.0 / _sqrt(dx*dx + dy*dy + 1e-9)
+                self.charge_dir = (dx * inv, dy * inv)
+                self.state = STATE_CHARGING
                 self.charge_timer = self.charge_time
 
     def draw(self, screen):
         """Desenha sprite de charging/idle; se faltarem imagens, usa círculo colorido com anel."""
-        if self.state == "charging" and self.charging_image:
-            rect = self.charging_image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.charging_image, rect)
-        elif self.state == "idle" and self.idle_image:
-            rect = self.idle_image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.idle_image, rect)
+        if self.state == STATE_CHARGING and self.charging_image:
+            screen.blit(self.charging_image, self._topleft())
+        elif self.state == STATE_IDLE and self.idle_image:
+            screen.blit(self.idle_image, self._topleft())
         else:
             # Fallback para desenho caso as imagens não carreguem
-            base_color = ORANGE if self.state != "charging" else RED
+            base_color = ORANGE if self.state != STATE_CHARGING else RED
             pygame.draw.circle(screen, base_color, (int(self.x), int(self.y)), self.size//2)
             pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), self.size//2 + 6, 2)
 
@@ -216,8 +338,7 @@ class BossSummoner(BossBase):
         self.minions_per_cast = 5
         
         # Carregar imagem
-        self.summoner_image = pygame.image.load("summoner.png").convert_alpha()
-        self.summoner_image = pygame.transform.smoothscale(self.summoner_image, (self.size, self.size))
+        self.summoner_image = sprite_cache.get("summoner.png", self.size)
 
     def update(self, dt, game):
         """
@@ -225,35 +346,35 @@ class BossSummoner(BossBase):
         Quando o cooldown zera, invoca `minions_per_cast` minions, checando paredes.
         """
         if self.is_dead_flag: return
+        player = game.player
+        walls = game.walls
+
         self._cd -= dt
-        dx = game.player.x - self.x
-        dy = game.player.y - self.y
-        dist = math.hypot(dx, dy)
-        if dist < 250:
-            self.move_towards_player(dt, game.player, game.walls, speed=-self.speed)
+        dx = player.x - self.x
+        dy = player.y - self.y
+        # Compara distância ao quadrado (250² = 62500), sem raiz
+        if dx*dx + dy*dy < 62500.0:
+            self.move_towards_player(dt, player, walls, speed=-self.speed)
         else:
-            angle = math.atan2(dy, dx) + math.pi/2
-            vx = math.cos(angle) * self.speed * dt
-            vy = math.sin(angle) * self.speed * dt
-            new_rect = pygame.Rect(int(self.x + vx - self.size//2), int(self.y + vy - self.size//2), self.size, self.size)
-            if not any(new_rect.colliderect(w) for w in game.walls):
+            angle = _atan2(dy, dx) + _pi/2
+            vx = _cos(angle) * self.speed * dt
+            vy = _sin(angle) * self.speed * dt
+            new_rect = self._scratch
+            new_rect.x = int(self.x + vx) - self._half
+            new_rect.y = int(self.y + vy) - self._half
+            if new_rect.collidelist(walls) == -1:
                 self.x += vx
                 self.y += vy
-                self.rect.center = (int(self.x), int(self.y))
+                self.rect.x = int(self.x) - self._half
+                self.rect.y = int(self.y) - self._half
         if self._cd <= 0:
             self._cd = self.summon_cd
-            for _ in range(self.minions_per_cast):
-                ex = int(self.x + random.randint(-120, 120))
-                ey = int(self.y + random.randint(-120, 120))
-                enemy_rect = pygame.Rect(ex - ENEMY_SIZE//2, ey - ENEMY_SIZE//2, ENEMY_SIZE, ENEMY_SIZE)
-                if not any(enemy_rect.colliderect(w) for w in game.walls):
-                    game.enemies.append(Enemy(ex, ey, wave=max(1, game.current_wave)))
+            self._summon_minions(game, walls)
     
     def draw(self, screen):
         """Desenha o sprite do summoner; fallback: círculo roxo."""
         if self.summoner_image:
-            rect = self.summoner_image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.summoner_image, rect)
+            screen.blit(self.summoner_image, self._topleft())
         else:
             pygame.draw.circle(screen, PURPLE, (int(self.x), int(self.y)), self.size//2)
 
@@ -273,11 +394,9 @@ class BossShielded(BossBase):
         self.invulnerable = False
 
         # Carregar imagens
-        self.invulnerable_image = pygame.image.load("shieldactive.png").convert_alpha()
-        self.invulnerable_image = pygame.transform.smoothscale(self.invulnerable_image, (self.size, self.size))
+        self.invulnerable_image = sprite_cache.get("shieldactive.png", self.size)
 
-        self.shielded_image = pygame.image.load("shieldinactive.png").convert_alpha()
-        self.shielded_image = pygame.transform.smoothscale(self.shielded_image, (self.size, self.size))
+        self.shielded_image = sprite_cache.get("shieldinactive.png", self.size)
 
     def take_damage(self, dmg: int, angle: Optional[float] = None):
         """Ignora dano quando invulnerável; caso contrário, delega à base (aplica knockback se houver ângulo)."""
@@ -291,14 +410,17 @@ class BossShielded(BossBase):
         Move-se mais rápido quando invulnerável.
         """
         if self.is_dead_flag: return
+        player = game.player
+        walls = game.walls
+
         self.timer -= dt
         if self.invulnerable:
-            self.move_towards_player(dt, game.player, game.walls, speed=self.speed+60)
+            self.move_towards_player(dt, player, walls, speed=self.speed+60)
             if self.timer <= 0:
                 self.invulnerable = False
                 self.timer = self.vulnerable_time
         else:
-            self.move_towards_player(dt, game.player, game.walls, speed=self.speed)
+            self.move_towards_player(dt, player, walls, speed=self.speed)
             if self.timer <= 0:
                 self.invulnerable = True
                 self.timer = self.invuln_time
@@ -307,8 +429,7 @@ class BossShielded(BossBase):
         """Desenha sprite/efeito de escudo quando invulnerável; fallback com anel branco."""
         if self.invulnerable:
             if self.invulnerable_image:
-                rect = self.invulnerable_image.get_rect(center=(int(self.x), int(self.y)))
-                screen.blit(self.invulnerable_image, rect)
+                screen.blit(self.invulnerable_image, self._topleft())
             else:
                 # Fallback quando invulnerável
                 col = (100, 160, 255)
@@ -316,8 +437,7 @@ class BossShielded(BossBase):
                 pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.size//2 + 10, 3)
         else:
             if self.shielded_image:
-                rect = self.shielded_image.get_rect(center=(int(self.x), int(self.y)))
-                screen.blit(self.shielded_image, rect)
+                screen.blit(self.shielded_image, self._topleft())
             else:
                 # Fallback quando vulnerável
                 col = (100, 255, 255)
@@ -340,8 +460,7 @@ class BossSniper(BossBase):
         self.bullets = []
         
         # Carregar imagem
-        self.sniper_image = pygame.image.load("sniper.png").convert_alpha()
-        self.sniper_image = pygame.transform.smoothscale(self.sniper_image, (self.size, self.size))
+        self.sniper_image = sprite_cache.get("sniper.png", self.size)
 
     def update(self, dt, game):
         """
@@ -349,54 +468,41 @@ class BossSniper(BossBase):
         Remove balas ao colidir com paredes ou com o jogador (aplicando dano).
         """
         if self.is_dead_flag: return
+        player = game.player
+        walls = game.walls
+
         self._tp_timer -= dt
         self._shoot_timer -= dt
 
-        self.move_towards_player(dt, game.player, game.walls, speed=self.speed)
+        self.move_towards_player(dt, player, walls, speed=self.speed)
 
         if self._shoot_timer <= 0:
             self._shoot_timer = self.shoot_cd
-            ang = math.atan2(game.player.y - self.y, game.player.x - self.x)
-            self.bullets.append(BossBullet(self.x, self.y, ang, speed=550, damage=50, size=8))
+            ang = _atan2(player.y - self.y, player.x - self.x)
+            self.bullets.append(bullet_pool.acquire(BossBullet, self.x, self.y, ang, speed=550, damage=50, size=8))
 
-        for b in self.bullets[:]:
-            if not b.update(dt, game.walls):
-                self.bullets.remove(b)
-            else:
-                if b.rect.colliderect(game.player.rect):
-                    game.player.take_damage(b.damage)
-                    if b in self.bullets:
-                        self.bullets.remove(b)
+        self._update_bullets(dt, player, walls)
 
         if self._tp_timer <= 0:
             self._tp_timer = self.teleport_cd
-            spots = [
-                (100, 100), (SCREEN_W-100, 100),
-                (100, SCREEN_H-100), (SCREEN_W-100, SCREEN_H-100),
-                (SCREEN_W//2, 100), (SCREEN_W//2, SCREEN_H-100)
-            ]
-            tx, ty = random.choice(spots)
-            r = pygame.Rect(tx - self.size//2, ty - self.size//2, self.size, self.size)
-            if not any(r.colliderect(w) for w in game.walls):
-                self.x, self.y = tx, ty
-                self.rect.center = (int(self.x), int(self.y))
+            self._teleport(walls)
 
     def draw(self, screen):
         """Desenha o sprite do sniper e suas balas; fallback: círculo azul-claro com contorno roxo."""
         if self.sniper_image:
-            rect = self.sniper_image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.sniper_image, rect)
+            screen.blit(self.sniper_image, self._topleft())
         else:
             # Fallback caso a imagem não carregue
             pygame.draw.circle(screen, (220, 220, 255), (int(self.x), int(self.y)), self.size//2)
             pygame.draw.circle(screen, PURPLE, (int(self.x), int(self.y)), self.size//2 + 8, 2)
-        for b in self.bullets:
-            b.draw(screen)
+        draw_bullets(screen, self.bullets)
 
 
 class BossSplitter(BossBase):
     """Chefe final híbrido: investida, invocação de minions, escudo alternado, teleporte e projéteis que se dividem."""
 
+    is_splitter = True
+
     def __init__(self, x, y):
         """
         Combina timers e estados dos demais bosses e carrega sprites de estado (normal/charge/shield).
@@ -408,42 +514,43 @@ class BossSplitter(BossBase):
         self.charge_speed = 700
         self.charge_time = 0.5
         self.charge_cd = 2.8
-        self.charge_timer = 0.0
         self.charge_dir = (0.0, 0.0)
-        self.state = "idle"
-        self._charge_cd = 1.2
+        self.state = STATE_IDLE
         self.contact_damage = 30
         self.knockback_power = 1200
         
         # Habilidade do BossSummoner: Invocação
         self.summon_cd = 4.0
-        self._summon_timer = 2.0
         self.minions_per_cast = 5
         
         # Habilidade do BossShielded: Escudo
         self.vulnerable_time = 3.0
         self.invuln_time = 3.0
-        self.shield_timer = self.vulnerable_time
         self.invulnerable = False
         
         # Habilidade do BossSniper: Teleporte
         self.teleport_cd = 3.0
-        self._tp_timer = 1.0
         
         # Sistema de tiro (balas que se dividem)
         self.shoot_cd = 1.5
-        self._shoot_timer = 0.5
         self.bullets = []
+
+        # Timers como prazos absolutos num relógio próprio: por frame só o relógio
+        # avança (uma soma) e cada habilidade compara `agora >= prazo`.
+        self._clock = 0.0
+        self._charge_at = 1.2
+        self._charge_end = 0.0
+        self._summon_at = 2.0
+        self._shield_at = self.vulnerable_time
+        self._tp_at = 1.0
+        self._shoot_at = 0.5
         
         # Carregar imagens
-        self.finalboss_image = pygame.image.load("finalboss.png").convert_alpha()
-        self.finalboss_image = pygame.transform.smoothscale(self.finalboss_image, (self.size, self.size))
+        self.finalboss_image = sprite_cache.get("finalboss.png", self.size)
         
-        self.finalboss_charge_image = pygame.image.load("finalbosscharge.png").convert_alpha()
-        self.finalboss_charge_image = pygame.transform.smoothscale(self.finalboss_charge_image, (self.size, self.size))
+        self.finalboss_charge_image = sprite_cache.get("finalbosscharge.png", self.size)
         
-        self.finalboss_shield_image = pygame.image.load("finalbossshield.png").convert_alpha()
-        self.finalboss_shield_image = pygame.transform.smoothscale(self.finalboss_shield_image, (self.size, self.size))
+        self.finalboss_shield_image = sprite_cache.get("finalbossshield.png", self.size)
 
     def take_damage(self, dmg: int, angle: Optional[float] = None):
         """Ignora dano enquanto invulnerável; caso contrário, aplica dano/knockback via base."""
@@ -451,134 +558,105 @@ class BossSplitter(BossBase):
             return
         super().take_damage(dmg, angle)
 
+    def _tick_charging(self, dt, player, walls, now):
+        """Habilidade do BossCharger: avança na charge_dir até bater em parede, no player ou o tempo acabar."""
+        cdx, cdy = self.charge_dir
+        step = self.charge_speed * dt
+        new_x = self.x + cdx * step
+        new_y = self.y + cdy * step
+        new_rect = self._scratch
+        new_rect.x = int(new_x) - self._half
+        new_rect.y = int(new_y) - self._half
+        
+        if new_rect.collidelist(walls) != -1:
+            self.state = STATE_IDLE
+            self._charge_at = now + self.charge_cd
+        else:
+            self.x, self.y = new_x, new_y
+            self.rect.x = int(self.x) - self._half
+            self.rect.y = int(self.y) - self._half
+            
+            if self.rect.colliderect(player.rect):
+                power = self.knockback_power
+                player.apply_impulse(cdx * power, cdy * power)
+                player.take_damage(self.contact_damage)
+                
+                self.state = STATE_IDLE
+                self._charge_at = now + self.charge_cd
+                self._charge_end = now
+        
+        if now >= self._charge_end and self.state == STATE_CHARGING:
+            self.state = STATE_IDLE
+            self._charge_at = now + self.charge_cd
+
+    def _tick_idle(self, dt, player, walls, now):
+        """Teleporte periódico, kiting/perseguição e início da investida quando o cooldown zera."""
+        # Habilidade do BossSniper: Teleporte
+        if now >= self._tp_at:
+            self._tp_at = now + self.teleport_cd
+            self._teleport(walls)
+        
+        # Movimento normal ou kiting
+        dx = player.x - self.x
+        dy = player.y - self.y
+        
+        if dx*dx + dy*dy < 62500.0:  # distância < 250, sem raiz
+            self.move_towards_player(dt, player, walls, speed=-self.speed)
+        else:
+            move_speed = self.speed + 60 if self.invulnerable else self.speed
+            self.move_towards_player(dt, player, walls, speed=move_speed)
+        
+        if now >= self._charge_at:
+            dx = player.x - self.x
+            dy = player.y - self.y
+            inv = 1.0 / _sqrt(dx*dx + dy*dy + 1e-9)
+            self.charge_dir = (dx * inv, dy * inv)
+            self.state = STATE_CHARGING
+            self._charge_end = now + self.charge_time
+
+    # Tabela de despacho indexada pelo estado (STATE_IDLE, STATE_CHARGING); cada tick recebe (dt, player, walls, now)
+    _STATE_TICKS = (_tick_idle, _tick_charging)
+
     def update(self, dt, game):
         """
         Atualiza todos os timers/estados (escudo, teleporte, investida, invocação e tiros divisores).
-        Em 'charging', move fixo na charge_dir; em 'idle', kiteia se perto (<250) ou persegue (mais rápido quando invulnerável).
+        Em STATE_CHARGING, move fixo na charge_dir; em STATE_IDLE, kiteia se perto (<250) ou persegue (mais rápido quando invulnerável).
         """
         if self.is_dead_flag:
             return
         
+        player = game.player
+        walls = game.walls
+
         # Atualiza timers
-        self._charge_cd -= dt
-        self._summon_timer -= dt
-        self._tp_timer -= dt
-        self._shoot_timer -= dt
-        self.shield_timer -= dt
+        self._clock += dt
+        now = self._clock
         
         # Habilidade do BossShielded: Alterna entre vulnerável e invulnerável
-        if self.invulnerable:
-            if self.shield_timer <= 0:
+        if now >= self._shield_at:
+            if self.invulnerable:
                 self.invulnerable = False
-                self.shield_timer = self.vulnerable_time
-        else:
-            if self.shield_timer <= 0:
-                self.invulnerable = True
-                self.shield_timer = self.invuln_time
-        
-        # Habilidade do BossCharger: Investida
-        if self.state == "charging":
-            self.charge_timer -= dt
-            
-            vx = self.charge_dir[0] * self.charge_speed * dt
-            vy = self.charge_dir[1] * self.charge_speed * dt
-            new_x = self.x + vx
-            new_y = self.y + vy
-            new_rect = pygame.Rect(int(new_x - self.size//2), int(new_y - self.size//2), self.size, self.size)
-            
-            if any(new_rect.colliderect(w) for w in game.walls):
-                self.state = "idle"
-                self._charge_cd = self.charge_cd
+                self._shield_at = now + self.vulnerable_time
             else:
-                self.x, self.y = new_x, new_y
-                self.rect.center = (int(self.x), int(self.y))
-                
-                if self.rect.colliderect(game.player.rect):
-                    kx = self.charge_dir[0] * self.knockback_power
-                    ky = self.charge_dir[1] * self.knockback_power
-                    game.player.apply_impulse(kx, ky)
-                    game.player.take_damage(self.contact_damage)
-                    
-                    self.state = "idle"
-                    self._charge_cd = self.charge_cd
-                    self.charge_timer = 0.0
-            
-            if self.charge_timer <= 0 and self.state == "charging":
-                self.state = "idle"
-                self._charge_cd = self.charge_cd
+                self.invulnerable = True
+                self._shield_at = now + self.invuln_time
         
-        elif self.state == "idle":
-            # Habilidade do BossSniper: Teleporte
-            if self._tp_timer <= 0:
-                self._tp_timer = self.teleport_cd
-                spots = [
-                    (100, 100), (SCREEN_W-100, 100),
-                    (100, SCREEN_H-100), (SCREEN_W-100, SCREEN_H-100),
-                    (SCREEN_W//2, 100), (SCREEN_W//2, SCREEN_H-100)
-                ]
-                tx, ty = random.choice(spots)
-                r = pygame.Rect(tx - self.size//2, ty - self.size//2, self.size, self.size)
-                if not any(r.colliderect(w) for w in game.walls):
-                    self.x, self.y = tx, ty
-                    self.rect.center = (int(self.x), int(self.y))
-            
-            # Movimento normal ou kiting
-            dx = game.player.x - self.x
-            dy = game.player.y - self.y
-            dist = math.hypot(dx, dy)
-            
-            if dist < 250:
-                self.move_towards_player(dt, game.player, game.walls, speed=-self.speed)
-            else:
-                move_speed = self.speed + 60 if self.invulnerable else self.speed
-                self.move_towards_player(dt, game.player, game.walls, speed=move_speed)
-            
-            if self._charge_cd <= 0:
-                dx = game.player.x - self.x
-                dy = game.player.y - self.y
-                d = math.hypot(dx, dy) or 1.0
-                self.charge_dir = (dx / d, dy / d)
-                self.state = "charging"
-                self.charge_timer = self.charge_time
+        # Investida (STATE_CHARGING) ou movimento/teleporte (STATE_IDLE)
+        self._STATE_TICKS[self.state](self, dt, player, walls, now)
         
         # Habilidade do BossSummoner: Invoca minions
-        if self._summon_timer <= 0:
-            self._summon_timer = self.summon_cd
-            for _ in range(self.minions_per_cast):
-                ex = int(self.x + random.randint(-120, 120))
-                ey = int(self.y + random.randint(-120, 120))
-                enemy_rect = pygame.Rect(ex - ENEMY_SIZE//2, ey - ENEMY_SIZE//2, ENEMY_SIZE, ENEMY_SIZE)
-                if not any(enemy_rect.colliderect(w) for w in game.walls):
-                    game.enemies.append(Enemy(ex, ey, wave=max(1, game.current_wave)))
+        if now >= self._summon_at:
+            self._summon_at = now + self.summon_cd
+            self._summon_minions(game, walls)
         
         # Sistema de tiro (balas que se dividem)
-        if self._shoot_timer <= 0:
-            self._shoot_timer = self.shoot_cd
-            ang = math.atan2(game.player.y - self.y, game.player.x - self.x)
-            self.bullets.append(SplitterBullet(self.x, self.y, ang, speed=400, damage=25, size=16, split_distance=300))
+        if now >= self._shoot_at:
+            self._shoot_at = now + self.shoot_cd
+            ang = _atan2(player.y - self.y, player.x - self.x)
+            self.bullets.append(bullet_pool.acquire(SplitterBullet, self.x, self.y, ang, speed=400, damage=25, size=16, split_distance=300))
 
         # Atualiza balas e verifica divisão
-        for b in self.bullets[:]:
-            if isinstance(b, SplitterBullet):
-                alive, split_bullets = b.update(dt, game.walls)
-                
-                if b.rect.colliderect(game.player.rect):
-                    game.player.take_damage(b.damage)
-                    self.bullets.remove(b)
-                    continue
-                
-                if not alive:
-                    self.bullets.remove(b)
-                    if split_bullets:
-                        self.bullets.extend(split_bullets)
-            else:
-                if not b.update(dt, game.walls):
-                    self.bullets.remove(b)
-                else:
-                    if b.rect.colliderect(game.player.rect):
-                        game.player.take_damage(b.damage)
-                        if b in self.bullets:
-                            self.bullets.remove(b)
+        self._update_bullets(dt, player, walls)
 
     def draw(self, screen):
         """
@@ -586,7 +664,7 @@ class BossSplitter(BossBase):
         Também desenha todas as balas ativas.
         """
         # Escolhe a imagem baseado no estado
-        if self.state == "charging" and self.finalboss_charge_image:
+        if self.state == STATE_CHARGING and self.finalboss_charge_image:
             image_to_use = self.finalboss_charge_image
         elif self.invulnerable and self.finalboss_shield_image:
             image_to_use = self.finalboss_shield_image
@@ -596,11 +674,10 @@ class BossSplitter(BossBase):
             image_to_use = None
         
         if image_to_use:
-            rect = image_to_use.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(image_to_use, rect)
+            screen.blit(image_to_use, self._topleft())
         else:
             # Fallback caso as imagens não carreguem
-            if self.state == "charging":
+            if self.state == STATE_CHARGING:
                 base_color = RED
             elif self.invulnerable:
                 base_color = (100, 160, 255)
@@ -614,5 +691,4 @@ class BossSplitter(BossBase):
             else:
                 pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), self.size//2 + 8, 2)
         
-        for b in self.bullets:
-            b.draw(screen)
+        draw_bullets(screen, self.bullets)
@@ -5,20 +5,109 @@ Classes:
 - Bullet: projétil padrão do jogador com alcance finito baseado em tempo de vida.
 - BossBullet: projétil simples usado por bosses; desaparece ao colidir com paredes ou sair da tela.
 - SplitterBullet: projétil grande que percorre uma distância e então se divide em 5 BossBullets.
+- BulletPool: pool de objetos que reaproveita projéteis descartados (instância global `bullet_pool`).
+
+Funções:
+- update_all: atualiza a lista de projéteis do jogador numa passada e devolve os sobreviventes.
+- draw_all: desenha uma lista de projéteis (do jogador ou de boss) com um único `Surface.blits`.
 
 Constantes esperadas de `constants`:
-- SCREEN_W, SCREEN_H e cores (YELLOW, PURPLE, ORANGE), entre outras.
+- SCREEN_W, SCREEN_H e cores (YELLOW, PURPLE, ORANGE), importadas explicitamente.
 """
 
 import pygame
 import math
-from constants import *
+from constants import SCREEN_W, SCREEN_H, YELLOW, PURPLE, ORANGE
 from typing import Optional
 
+_sprite_cache = {}
+
+# Divisão do SplitterBullet: 5 filhas a -30, -15, 0, 15 e 30 graus da direção original,
+# com (offset, cos(offset), sin(offset)) calculados uma única vez
+SPLIT_CHILD_SPEED = 450
+_SPLIT_OFFSETS = tuple((o, math.cos(o), math.sin(o)) for o in ((i - 2) * (math.pi / 12) for i in range(5)))
+
+# Limites da área de jogo (+50px de margem) já somados, para o teste de saída da tela
+_MIN_X, _MAX_X = -50, SCREEN_W + 50
+_MIN_Y, _MAX_Y = -50, SCREEN_H + 50
+
+
+def _circle_sprite(radius: int, layers) -> pygame.Surface:
+    """
+    Retorna (e cacheia) um sprite com círculos concêntricos pré-renderizados.
+
+    Args:
+        radius (int): raio externo do sprite.
+        layers (tuple[tuple[color, int], ...]): pares (cor, recuo do raio) desenhados em ordem.
+
+    Returns:
+        pygame.Surface: superfície SRCALPHA de lado 2*radius (compartilhada).
+    """
+    key = (radius, layers)
+    surface = _sprite_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        for color, inset in layers:
+            pygame.draw.circle(surface, color, (radius, radius), radius - inset)
+        _sprite_cache[key] = surface
+    return surface
+
+
+def draw_all(screen, bullets):
+    """
+    Desenha todos os projéteis com sprite pré-renderizado em uma única chamada de blit em lote.
+
+    Args:
+        screen (pygame.Surface | RenderBatch): superfície (ou lote) de destino.
+        bullets (Iterable): projéteis com `image`, `radius` e posição inteira `ix`/`iy`.
+    """
+    screen.blits([(b.image, (b.ix - b.radius, b.iy - b.radius)) for b in bullets], doreturn=False)
+
+
+def update_all(bullets, dt: float, walls):
+    """
+    Atualiza todos os projéteis do jogador numa única passada e devolve os que seguem ativos.
+
+    Cada bala avança pelo vetor velocidade e acumula tempo de vida; sai da lista ao
+    bater numa parede (`collidelist`, em C) ou ao esgotar `max_life`. É a única
+    atualização das balas do jogador (`Bullet` não tem `update` próprio).
+
+    Args:
+        bullets (list[Bullet]): projéteis do jogador.
+        dt (float): delta de tempo.
+        walls (list[pygame.Rect]): retângulos de colisão.
+
+    Returns:
+        list[Bullet]: projéteis que não colidiram nem expiraram.
+    """
+    alive = []
+    keep = alive.append
+    for b in bullets:
+        x = b.x + b.vx * dt
+        y = b.y + b.vy * dt
+        b.x = x
+        b.y = y
+        life = b.life + dt
+        b.life = life
+        ix = int(x)
+        iy = int(y)
+        b.ix = ix
+        b.iy = iy
+        rect = b.rect
+        rect.center = (ix, iy)
+        if life < b.max_life and rect.collidelist(walls) == -1:
+            keep(b)
+    return alive
+
 
 class Bullet:
     """Projétil básico do jogador, com dano, velocidade e tempo de vida (alcance) derivado de range/speed."""
 
+    __slots__ = (
+        'x', 'y', 'ix', 'iy', 'angle', 'damage', 'vx', 'vy',
+        'life', 'max_life', 'rect', 'size', 'radius', 'image',
+    )
+
     def __init__(self, x: float, y: float, angle: float, damage: int, speed: float, range_val: float, size: int):
         """
         Inicializa um projétil.
@@ -39,44 +128,22 @@ class Bullet:
         self.vy = math.sin(angle) * speed
         self.life = 0.0
         self.max_life = range_val / speed
+        self.ix = int(x)
+        self.iy = int(y)
         self.rect = pygame.Rect(int(x - size//2), int(y - size//2), size, size)
         self.size = size
-
-    def update(self, dt: float, walls):
-        """
-        Avança a posição pelo vetor velocidade, acumula tempo de vida e verifica colisão com paredes.
-
-        Args:
-            dt (float): delta de tempo.
-            walls (Iterable[pygame.Rect]): retângulos de colisão.
-
-        Returns:
-            bool: True se ainda está ativo (não colidiu e não expirou); False caso contrário.
-        """
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.life += dt
-        self.rect.center = (int(self.x), int(self.y))
-
-        for wall in walls:
-            if self.rect.colliderect(wall):
-                return False
-        return self.life < self.max_life
-
-    def draw(self, screen):
-        """
-        Desenha o projétil como um círculo amarelo.
-
-        Args:
-            screen (pygame.Surface): superfície de destino.
-        """
-        pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), self.size//2)
+        self.radius = size // 2
+        self.image = _circle_sprite(self.radius, ((YELLOW, 0),))
 
 
 class BossBullet:
     """Projétil simples disparado por chefes; some ao colidir com paredes ou ao sair da área de jogo (+50px de margem)."""
 
-    def __init__(self, x, y, angle, speed=500, damage=25, size=8):
+    __slots__ = (
+        'x', 'y', 'ix', 'iy', 'vx', 'vy', 'size', 'rect', 'damage', 'radius', 'image',
+    )
+
+    def __init__(self, x, y, angle, speed=500, damage=25, size=8, velocity=None):
         """
         Inicializa o projétil do boss.
 
@@ -86,14 +153,23 @@ class BossBullet:
             speed (float): velocidade (px/s).
             damage (int): dano causado ao atingir o jogador.
             size (int): diâmetro usado na colisão/desenho.
+            velocity (tuple[float, float] | None): (vx, vy) já calculado; quando informado,
+                dispensa o cos/sin de `angle` e `speed`.
         """
         self.x = x
         self.y = y
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
+        if velocity is None:
+            self.vx = math.cos(angle) * speed
+            self.vy = math.sin(angle) * speed
+        else:
+            self.vx, self.vy = velocity
         self.size = size
+        self.ix = int(x)
+        self.iy = int(y)
         self.rect = pygame.Rect(int(x - size//2), int(y - size//2), size, size)
         self.damage = damage
+        self.radius = size // 2
+        self.image = _circle_sprite(self.radius, ((PURPLE, 0),))
 
     def update(self, dt, walls):
         """
@@ -104,31 +180,31 @@ class BossBullet:
             walls (Iterable[pygame.Rect]): paredes para colisão.
 
         Returns:
-            bool: True se continua ativo; False se colidiu ou saiu dos limites.
+            tuple[bool, None]: (True se continua ativo; False se colidiu ou saiu dos limites,
+            None), no mesmo formato de `SplitterBullet.update`.
         """
         self.x += self.vx * dt
         self.y += self.vy * dt
-        self.rect.center = (int(self.x), int(self.y))
-        for w in walls:
-            if self.rect.colliderect(w):
-                return False
-        if self.x < -50 or self.x > SCREEN_W + 50 or self.y < -50 or self.y > SCREEN_H + 50:
-            return False
-        return True
-
-    def draw(self, screen):
-        """
-        Desenha o projétil do boss como um círculo roxo.
-
-        Args:
-            screen (pygame.Surface): superfície de destino.
-        """
-        pygame.draw.circle(screen, PURPLE, (int(self.x), int(self.y)), self.size//2)
+        ix = int(self.x)
+        iy = int(self.y)
+        self.ix = ix
+        self.iy = iy
+        self.rect.center = (ix, iy)
+        if self.rect.collidelist(walls) != -1:
+            return False, None
+        if not (_MIN_X <= self.x <= _MAX_X and _MIN_Y <= self.y <= _MAX_Y):
+            return False, None
+        return True, None
 
 
 class SplitterBullet:
     """Bala grande que se divide em 5 balas menores após uma certa distância."""
 
+    __slots__ = (
+        'start_x', 'start_y', 'x', 'y', 'ix', 'iy', 'angle', 'vx', 'vy', 'size', 'rect',
+        'damage', 'split_distance', '_split_distance_sq', 'has_split', 'radius', 'image',
+    )
+
     def __init__(self, x, y, angle, speed=400, damage=25, size=16, split_distance=300):
         """
         Inicializa o projétil divisor.
@@ -149,11 +225,15 @@ class SplitterBullet:
         self.vx = math.cos(angle) * speed
         self.vy = math.sin(angle) * speed
         self.size = size
+        self.ix = int(x)
+        self.iy = int(y)
         self.rect = pygame.Rect(int(x - size//2), int(y - size//2), size, size)
         self.damage = damage
         self.split_distance = split_distance
-        self.distance_traveled = 0.0
+        self._split_distance_sq = split_distance * split_distance
         self.has_split = False
+        self.radius = size // 2
+        self.image = _circle_sprite(self.radius, ((ORANGE, 0), (YELLOW, 2)))
 
     def update(self, dt, walls):
         """
@@ -173,45 +253,78 @@ class SplitterBullet:
         
         self.x += self.vx * dt
         self.y += self.vy * dt
-        self.rect.center = (int(self.x), int(self.y))
+        ix = int(self.x)
+        iy = int(self.y)
+        self.ix = ix
+        self.iy = iy
+        self.rect.center = (ix, iy)
         
-        # Calcula distância percorrida
+        # Distância percorrida (ao quadrado, dispensa a raiz)
         dx = self.x - self.start_x
         dy = self.y - self.start_y
-        self.distance_traveled = math.hypot(dx, dy)
+        traveled_sq = dx*dx + dy*dy
         
         # Verifica colisão com paredes
-        for w in walls:
-            if self.rect.colliderect(w):
-                return False, []
+        if self.rect.collidelist(walls) != -1:
+            return False, []
         
         # Verifica se saiu da tela
-        if self.x < -50 or self.x > SCREEN_W + 50 or self.y < -50 or self.y > SCREEN_H + 50:
+        if not (_MIN_X <= self.x <= _MAX_X and _MIN_Y <= self.y <= _MAX_Y):
             return False, []
         
         # Verifica se deve dividir
-        if self.distance_traveled >= self.split_distance and not self.has_split:
+        if traveled_sq >= self._split_distance_sq and not self.has_split:
             self.has_split = True
-            # Cria 5 balas menores em diferentes ângulos
-            split_bullets = []
+            # Cria 5 balas menores girando a direção original pelos offsets pré-calculados
             base_angle = self.angle
-            spread_angle = math.pi / 3  # 60 graus de spread total
-            for i in range(5):
-                # Distribui os ângulos: -60, -30, 0, 30, 60 graus em relação ao ângulo original
-                offset = (i - 2) * (spread_angle / 4)
-                new_angle = base_angle + offset
-                split_bullets.append(BossBullet(self.x, self.y, new_angle, speed=450, damage=self.damage // 2, size=8))
+            ca = math.cos(base_angle) * SPLIT_CHILD_SPEED
+            sa = math.sin(base_angle) * SPLIT_CHILD_SPEED
+            x, y = self.x, self.y
+            damage = self.damage // 2
+            acquire = bullet_pool.acquire
+            split_bullets = [
+                acquire(BossBullet, x, y, base_angle + offset, damage=damage, size=8,
+                        velocity=(ca * co - sa * so, sa * co + ca * so))
+                for offset, co, so in _SPLIT_OFFSETS
+            ]
             return False, split_bullets
         
         return True, []
 
-    def draw(self, screen):
+
+class BulletPool:
+    """Pool de projéteis: reaproveita instâncias descartadas em vez de alocar uma nova a cada tiro."""
+
+    def __init__(self):
+        """Cria o pool vazio, com uma lista de instâncias livres por classe."""
+        self._free = {}
+
+    def acquire(self, cls, *args, **kwargs):
         """
-        Desenha a bala grande com dois círculos concêntricos (laranja/amarelo) para destacá-la.
+        Retorna um projétil de `cls` inicializado com os argumentos dados.
+
+        Reaproveita uma instância livre (reexecutando `__init__`) quando houver;
+        caso contrário, cria uma nova.
 
         Args:
-            screen (pygame.Surface): superfície de destino.
+            cls (type): classe do projétil (BossBullet, SplitterBullet...).
+            *args, **kwargs: argumentos repassados ao construtor.
         """
-        # Desenha a bala grande em laranja/amarelo para diferenciá-la
-        pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), self.size//2)
-        pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), self.size//2 - 2)
\ No newline at end of file
+        free = self._free.get(cls)
+        if free:
+            bullet = free.pop()
+            bullet.__init__(*args, **kwargs)
+            return bullet
+        return cls(*args, **kwargs)
+
+    def release(self, bullet):
+        """
+        Devolve um projétil ao pool. Quem o liberou não deve mais usá-lo.
+
+        Args:
+            bullet: projétil que saiu de jogo.
+        """
+        self._free.setdefault(type(bullet), []).append(bullet)
+
+
+bullet_pool = BulletPool()
@@ -35,6 +35,13 @@ ENEMY_HP = 50
 ENEMY_DAMAGE = 20 
 ENEMY_SPAWN_RATE = 1.0
 
+# Power-ups
+POWER_UP_SIZE = 28
+
+# Bosses (lógica em passo fixo, independente do FPS de render)
+BOSS_TICK = 1 / 120
+BOSS_MAX_TICKS = 8  # limite de passos por frame para não "espiralar" após travadas
+
 # Cores (RGB)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -58,6 +65,9 @@ Caminhos de arquivos de áudio:
 POWER_UP_SOUND_FILE = "power-up-type-1-230548.mp3"
 GUNSHOT_SOUND_FILE = "gunshot-352466.mp3"
 BACKGROUND_MUSIC_FILE = "game-minecraft-gaming-background-music-402451.mp3"
+MIXER_CHANNELS = 8  # canais do mixer alocados uma vez na inicialização
+GUN_CHANNEL = 0  # canal reservado ao disparo
+POWER_UP_CHANNEL = 1  # canal reservado ao power-up
 
 # Imagens
 """
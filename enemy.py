@@ -2,11 +2,13 @@
 Módulo Enemy — define a classe `Enemy` usada no jogo Pygame.
 
 Funções principais:
-- Movimento dos inimigos em direção ao jogador.
-- Ataque corpo-a-corpo com cooldown.
 - Recebimento de dano e knockback.
-- Animação de morte com partículas e fade-out.
+- Animação de morte com partículas (via `particles`) e fade-out.
 - Renderização com sprite (se disponível) ou fallback colorido com barra de HP.
+- update_all: movimento em direção ao jogador, decaimento do knockback, ataque
+  corpo-a-corpo com cooldown e fade de todos os inimigos numa passada (única
+  implementação da IA dos inimigos).
+- draw_all: renderização em lote de todos os inimigos (um `Surface.blits` por frame).
 
 Depende de:
 - constantes.py (ENEMY_SIZE, ENEMY_SPEED, etc.)
@@ -16,8 +18,147 @@ Depende de:
 import pygame
 import math
 import random
-from constants import *
+from constants import (
+    ENEMY_SIZE, ENEMY_SPEED, ENEMY_HP, ENEMY_DAMAGE, ENEMY_IMAGE_FILE,
+    DARK_GRAY, GREEN,
+)
 from typing import Optional
+from particles import particles
+import sprite_cache
+
+# Paleta de círculos pré-renderizados por faixa de HP (fallback sem sprite)
+HP_BUCKETS = 16
+_hp_circle_cache = []
+
+HP_BAR_W, HP_BAR_H = 30, 4
+
+ENEMY_ATTACK_RANGE_SQ = 30 * 30  # alcance do ataque corpo-a-corpo, ao quadrado
+ENEMY_KNOCKBACK_DECAY = 8.0  # taxa (1/s) do decaimento exponencial do knockback
+
+# Rect de rascunho para testar a posição candidata sem alocar um Rect por inimigo/frame
+_scratch_rect = pygame.Rect(0, 0, ENEMY_SIZE, ENEMY_SIZE)
+
+
+def _hp_circle(ratio: float) -> pygame.Surface:
+    """
+    Retorna o círculo de fallback já tingido para a faixa de HP de `ratio`.
+
+    Args:
+        ratio (float): HP atual / HP máximo, entre 0 e 1.
+
+    Returns:
+        pygame.Surface: superfície SRCALPHA ENEMY_SIZE x ENEMY_SIZE (compartilhada).
+    """
+    if not _hp_circle_cache:
+        for bucket in range(HP_BUCKETS):
+            r = bucket / (HP_BUCKETS - 1)
+            surface = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE), pygame.SRCALPHA)
+            color = (int(255 * (1 - r)), int(255 * r), 0)
+            pygame.draw.circle(surface, color, (ENEMY_SIZE//2, ENEMY_SIZE//2), ENEMY_SIZE//2)
+            _hp_circle_cache.append(surface)
+    return _hp_circle_cache[min(HP_BUCKETS - 1, int(ratio * HP_BUCKETS))]
+
+
+def update_all(enemies, dt: float, player, walls, current_time: float):
+    """
+    Atualiza e resolve o ataque de todos os inimigos numa única passada.
+
+    Mortos só acumulam o tempo de fade (e saem quando `is_dead()`); vivos perseguem o
+    jogador somando o knockback residual, testam a nova posição contra as paredes e
+    atacam se estiverem no alcance e fora do cooldown. As invariantes do frame
+    (posição do jogador, paredes, fator de decaimento) são lidas uma vez.
+
+    Args:
+        enemies (list[Enemy]): inimigos ativos.
+        dt (float): delta de tempo.
+        player: jogador com .x, .y e take_damage().
+        walls (list[pygame.Rect]): obstáculos no mapa.
+        current_time (float): tempo atual do jogo (em segundos).
+
+    Returns:
+        list[Enemy]: inimigos que continuam em jogo.
+    """
+    px = player.x
+    py = player.y
+    half = ENEMY_SIZE // 2
+    probe = _scratch_rect
+    # Decaimento exato exp(-k*dt): mesmo fator para todos os inimigos no frame
+    decay_mul = math.exp(-ENEMY_KNOCKBACK_DECAY * dt)
+    alive = []
+    keep = alive.append
+    for e in enemies:
+        if e.is_dead_flag:
+            e.death_timer += dt
+            if e.death_timer < e.fade_duration:
+                keep(e)
+            continue
+
+        x = e.x
+        y = e.y
+        dx = px - x
+        dy = py - y
+        d2 = dx*dx + dy*dy
+        if d2 > 0:
+            inv = e.speed * dt / math.sqrt(d2)
+            kx = e.knockback_x
+            ky = e.knockback_y
+            e.knockback_x = kx * decay_mul
+            e.knockback_y = ky * decay_mul
+            new_x = x + dx * inv + kx * dt
+            new_y = y + dy * inv + ky * dt
+            probe.x = int(new_x - half)
+            probe.y = int(new_y - half)
+            if probe.collidelist(walls) == -1:
+                e.x = new_x
+                e.y = new_y
+                ix = int(new_x)
+                iy = int(new_y)
+                e.ix = ix
+                e.iy = iy
+                e.rect.center = (ix, iy)
+
+        # Ataque corpo-a-corpo (distância medida na posição atualizada)
+        dx = px - e.x
+        dy = py - e.y
+        if dx*dx + dy*dy <= ENEMY_ATTACK_RANGE_SQ and (current_time - e.last_attack) >= e.attack_cooldown:
+            player.take_damage(e.damage)
+            e.last_attack = current_time
+        keep(e)
+    return alive
+
+
+def draw_all(screen, enemies):
+    """
+    Desenha todos os inimigos vivos com um único `Surface.blits` e as barras de HP com `fill`.
+
+    Inimigos mortos (fade-out) continuam sendo desenhados individualmente; as partículas
+    ficam a cargo de `particles.particles`.
+
+    Args:
+        screen (pygame.Surface | RenderBatch): superfície (ou lote) de destino.
+        enemies (Iterable[Enemy]): inimigos a desenhar.
+    """
+    half = ENEMY_SIZE // 2
+    img = Enemy._image_surface
+    sprites = []
+    bars = []
+    for e in enemies:
+        if e.is_dead_flag:
+            e._draw_fade(screen)
+            continue
+        ix = e.ix
+        iy = e.iy
+        ratio = e.hp / e.max_hp
+        sprites.append((img if img is not None else _hp_circle(ratio), (ix - half, iy - half)))
+        bars.append((ix - HP_BAR_W//2, iy - half - 10, int(ratio * HP_BAR_W)))
+    screen.blits(sprites, doreturn=False)
+
+    # Barras de HP por cima de todos os corpos
+    fill = screen.fill
+    for bx, by, health_w in bars:
+        fill(DARK_GRAY, (bx, by, HP_BAR_W, HP_BAR_H))
+        if health_w > 0:
+            fill(GREEN, (bx, by, health_w, HP_BAR_H))
 
 
 class Enemy:
@@ -29,6 +170,29 @@ class Enemy:
     Pode carregar um sprite (imagem) ou usar um círculo colorido como fallback.
     """
 
+    __slots__ = (
+        'x', 'y', 'ix', 'iy', 'max_hp', 'hp', 'speed', 'damage', 'last_attack', 'attack_cooldown',
+        'rect', 'is_dead_flag', 'death_timer', 'fade_duration',
+        'knockback_x', 'knockback_y',
+    )
+
+    # Sprite compartilhado por todos os inimigos; carregado por `preload()`
+    _image_surface = None
+
+    @classmethod
+    def preload(cls):
+        """
+        Carrega o sprite dos inimigos uma única vez (chamar após `pygame.display.set_mode`).
+
+        Se o arquivo não puder ser carregado, os inimigos usam o círculo colorido de fallback.
+        """
+        if cls._image_surface is not None:
+            return
+        try:
+            cls._image_surface = sprite_cache.get(ENEMY_IMAGE_FILE, ENEMY_SIZE)
+        except Exception as e:
+            print(f"Warning: Could not load {ENEMY_IMAGE_FILE}: {e}")
+
     def __init__(self, x: float, y: float, wave: int = 1):
         """
         Inicializa um inimigo na posição (x, y), ajustando HP e velocidade com base na wave atual.
@@ -37,14 +201,6 @@ class Enemy:
             x, y (float): coordenadas iniciais do inimigo.
             wave (int): número da wave, afeta HP e velocidade.
         """
-        # Carregar imagem do inimigo (apenas uma vez para otimizar)
-        if not hasattr(Enemy, "_image_loaded"):
-            Enemy._image_loaded = False
-            Enemy._image_surface = None
-            loaded = pygame.image.load(ENEMY_IMAGE_FILE).convert_alpha()
-            Enemy._image_surface = pygame.transform.smoothscale(loaded, (ENEMY_SIZE, ENEMY_SIZE))
-            Enemy._image_loaded = True
-
         # Atributos principais
         self.x = x
         self.y = y
@@ -54,74 +210,18 @@ class Enemy:
         self.damage = ENEMY_DAMAGE
         self.last_attack = 0.0
         self.attack_cooldown = 1.0
+        self.ix = int(x)
+        self.iy = int(y)
         self.rect = pygame.Rect(int(x - ENEMY_SIZE//2), int(y - ENEMY_SIZE//2), ENEMY_SIZE, ENEMY_SIZE)
 
         # Estado de morte e partículas
         self.is_dead_flag = False
         self.death_timer = 0.0
         self.fade_duration = 0.8
-        self.death_particles = []
 
-        # Knockback (recuo após dano)
+        # Knockback (recuo após dano; decai a ENEMY_KNOCKBACK_DECAY em update_all)
         self.knockback_x = 0.0
         self.knockback_y = 0.0
-        self.knockback_decay = 8.0
-
-        # Flag de imagem carregada
-        self.image_available = getattr(Enemy, "_image_loaded", False)
-
-    def update(self, dt: float, player, walls):
-        """
-        Atualiza posição e estado do inimigo.
-
-        - Se morto, apenas acumula tempo de fade.
-        - Caso vivo, move-se em direção ao jogador com checagem de colisão e aplica amortecimento de knockback.
-
-        Args:
-            dt (float): delta de tempo entre frames.
-            player: objeto jogador com .x, .y.
-            walls (list[pygame.Rect]): obstáculos no mapa.
-        """
-        if self.is_dead_flag:
-            self.death_timer += dt
-            return
-
-        dx = player.x - self.x
-        dy = player.y - self.y
-        dist = math.hypot(dx, dy)
-
-        if dist > 0:
-            dx = (dx / dist) * self.speed * dt
-            dy = (dy / dist) * self.speed * dt
-
-            # Aplicar knockback residual
-            dx += self.knockback_x * dt
-            dy += self.knockback_y * dt
-            self.knockback_x -= self.knockback_x * self.knockback_decay * dt
-            self.knockback_y -= self.knockback_y * self.knockback_decay * dt
-
-            new_x = self.x + dx
-            new_y = self.y + dy
-
-            new_rect = pygame.Rect(new_x - ENEMY_SIZE//2, new_y - ENEMY_SIZE//2, ENEMY_SIZE, ENEMY_SIZE)
-            if not any(new_rect.colliderect(w) for w in walls):
-                self.x = new_x
-                self.y = new_y
-                self.rect.center = (int(self.x), int(self.y))
-
-    def attack(self, player, current_time: float):
-        """
-        Tenta atacar o jogador se estiver próximo e se o cooldown tiver acabado.
-
-        Args:
-            player: jogador com método take_damage().
-            current_time (float): tempo atual do jogo (em segundos).
-        """
-        if self.is_dead_flag:
-            return
-        if math.hypot(player.x - self.x, player.y - self.y) <= 30 and (current_time - self.last_attack) >= self.attack_cooldown:
-            player.take_damage(self.damage)
-            self.last_attack = current_time
 
     def take_damage(self, damage: int, angle: Optional[float] = None):
         """
@@ -139,7 +239,7 @@ class Enemy:
             self.knockback_y = math.sin(angle) * 300
 
         # Partícula de impacto
-        self.death_particles.append({"x": self.x, "y": self.y, "radius": 6, "life": 0.3, "color": (255, 255, 0)})
+        particles.spawn(self.x, self.y, 6, 0.3, (255, 255, 0))
 
         if self.hp <= 0:
             self.die()
@@ -154,14 +254,14 @@ class Enemy:
         self.is_dead_flag = True
         self.death_timer = 0.0
         for _ in range(10):
-            self.death_particles.append({
-                "x": self.x, "y": self.y,
-                "radius": random.randint(3, 6),
-                "vx": random.uniform(-150, 150),
-                "vy": random.uniform(-150, 150),
-                "life": random.uniform(0.4, 0.8),
-                "color": (255, random.randint(100, 200), 0)
-            })
+            particles.spawn(
+                self.x, self.y,
+                random.randint(3, 6),
+                random.uniform(0.4, 0.8),
+                (255, random.randint(100, 200), 0),
+                vx=random.uniform(-150, 150),
+                vy=random.uniform(-150, 150),
+            )
 
     def is_dead(self) -> bool:
         """
@@ -172,46 +272,9 @@ class Enemy:
         """
         return self.is_dead_flag and self.death_timer >= self.fade_duration
 
-    def draw(self, screen):
-        """
-        Renderiza o inimigo na tela.
-
-        - Se morto, exibe partículas e efeito de fade-out.
-        - Caso vivo, desenha sprite ou círculo colorido proporcional ao HP.
-        - Inclui uma barra de HP acima do inimigo.
-        """
-        # Atualizar partículas
-        for p in self.death_particles[:]:
-            p["x"] += p.get("vx", 0) * 0.016
-            p["y"] += p.get("vy", 0) * 0.016
-            p["life"] -= 0.016
-            if p["life"] <= 0:
-                self.death_particles.remove(p)
-            else:
-                pygame.draw.circle(screen, p["color"], (int(p["x"]), int(p["y"])), max(1, int(p["radius"])))
-
-        # Render de fade-out
-        if self.is_dead_flag:
-            alpha = max(0, 255 * (1 - self.death_timer / self.fade_duration))
-            surface = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE), pygame.SRCALPHA)
-            pygame.draw.circle(surface, (255, 50, 0, int(alpha)), (ENEMY_SIZE//2, ENEMY_SIZE//2), ENEMY_SIZE//2)
-            screen.blit(surface, (self.x - ENEMY_SIZE//2, self.y - ENEMY_SIZE//2))
-            return
-
-        # Sprite ou fallback colorido
-        img = getattr(Enemy, "_image_surface", None)
-        if self.image_available and img is not None:
-            rect = img.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(img, rect)
-        else:
-            ratio = self.hp / self.max_hp
-            color = (int(255 * (1 - ratio)), int(255 * ratio), 0)
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), ENEMY_SIZE//2)
-
-        # Barra de HP
-        bar_w, bar_h = 30, 4
-        bar_x = self.x - bar_w//2
-        bar_y = self.y - ENEMY_SIZE//2 - 10
-        pygame.draw.rect(screen, DARK_GRAY, (bar_x, bar_y, bar_w, bar_h))
-        health_w = int((self.hp / self.max_hp) * bar_w)
-        pygame.draw.rect(screen, GREEN, (bar_x, bar_y, health_w, bar_h))
\ No newline at end of file
+    def _draw_fade(self, screen):
+        """Desenha o círculo de fade-out de um inimigo morto."""
+        alpha = max(0, 255 * (1 - self.death_timer / self.fade_duration))
+        surface = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 50, 0, int(alpha)), (ENEMY_SIZE//2, ENEMY_SIZE//2), ENEMY_SIZE//2)
+        screen.blit(surface, (self.x - ENEMY_SIZE//2, self.y - ENEMY_SIZE//2))
@@ -5,15 +5,32 @@ Loop principal do Bullet Echo: estados, eventos, spawns, rendering e interface.
 import pygame
 import random
 import sys
+from collections import OrderedDict
+from operator import attrgetter
 from constants import *
 from player import Player
-from enemy import Enemy
-from bullets import Bullet
-from powerup import PowerUp
+from enemy import Enemy, update_all as update_enemies, draw_all as draw_enemies
+from bullets import Bullet, update_all as update_bullets, draw_all as draw_bullets
+from powerup import PowerUp, update_all as update_power_ups, draw_all as draw_power_ups
 from bosses import (
     BossCharger, BossSummoner, BossShielded, BossSniper, BossSplitter
 )
-from snow import Snowflake, WindOverlay
+from snow import SnowField, WindOverlay
+from spatial_hash import EntityGrid, BRUTE_FORCE_LIMIT
+from particles import particles
+from render_batch import RenderBatch
+
+TEXT_CACHE_SIZE = 64  # máximo de textos renderizados mantidos em cache
+
+_rect_of = attrgetter("rect")
+
+# Faixas (x0, x1, y0, y1) de spawn de inimigos em cada borda: topo, baixo, esquerda, direita
+SPAWN_EDGES = (
+    (100, SCREEN_W - 100, 50, 100),
+    (100, SCREEN_W - 100, SCREEN_H - 100, SCREEN_H - 50),
+    (50, 100, 100, SCREEN_H - 100),
+    (SCREEN_W - 100, SCREEN_W - 50, 100, SCREEN_H - 100),
+)
 
 class Game:
     """Gerencia ciclo principal: eventos, lógica de waves, áudio, rendering e UI."""
@@ -25,17 +42,35 @@ class Game:
             pygame.mixer.init()
         self.power_up_sound = None
         self.gunshot_sound = None
+        self._gun_channel = None
+        self._power_up_channel = None
         if pygame.mixer.get_init() is not None:
             self.power_up_sound = pygame.mixer.Sound(POWER_UP_SOUND_FILE)
             self.gunshot_sound = pygame.mixer.Sound(GUNSHOT_SOUND_FILE)
+            # Canais fixos e reservados: cada disparo toca direto no seu canal, sem busca por canal livre
+            pygame.mixer.set_num_channels(MIXER_CHANNELS)
+            pygame.mixer.set_reserved(2)
+            self._gun_channel = pygame.mixer.Channel(GUN_CHANNEL)
+            self._power_up_channel = pygame.mixer.Channel(POWER_UP_CHANNEL)
             pygame.mixer.music.load(BACKGROUND_MUSIC_FILE)
             pygame.mixer.music.set_volume(0.2)
             pygame.mixer.music.play(-1)
-        self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+        # VSync deixa o monitor ditar a cadência; clock.tick(FPS) em run() segue como teto
+        try:
+            self.screen = pygame.display.set_mode(
+                (SCREEN_W, SCREEN_H), pygame.SCALED | pygame.DOUBLEBUF, vsync=1
+            )
+        except pygame.error as e:
+            print(f"Warning: VSync unavailable, using a plain window: {e}")
+            self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
         pygame.display.set_caption("Bullet Echo")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self._text_cache = OrderedDict()
+        self.frame_time = pygame.time.get_ticks() / 1000.0
+        self.mouse_pos = (0, 0)
+        self._static_frame_key = None
 
         # Carregar imagens
         try:
@@ -50,10 +85,23 @@ class Game:
         except Exception as e:
             print(f"Warning: Could not load background.png: {e}")
             self.background_image = None
-            self.background_image = None
+
+        # Fallback do menu (sem inicio.png): título e subtítulo rasterizados uma única vez
+        self._menu_fallback = []
+        if self.menu_image is None:
+            title = self.font.render("BULLET ECHO", True, BLUE)
+            sub = self.small_font.render("Pressione ESPAÇO para começar", True, WHITE)
+            self._menu_fallback = [
+                (title, title.get_rect(center=(SCREEN_W//2, 200))),
+                (sub, sub.get_rect(center=(SCREEN_W//2, 300))),
+            ]
+        Enemy.preload()
+        PowerUp.preload()
+        self.render_batch = RenderBatch()
 
         # Efeitos climáticos
-        self.snowflakes = [Snowflake() for _ in range(160)]
+        self.snowfield = SnowField(160)
+        self._weather_dt = 0.0
         self.wind_overlay = WindOverlay()
 
         # Estado
@@ -72,6 +120,9 @@ class Game:
         self.bullets = []
         self.enemies = []
         self.walls = self.create_map()
+        self.enemy_grid = EntityGrid(cell_size=2 * ENEMY_SIZE)
+        self._enemy_rects = []
+        self.arena_surface = self.build_arena_surface()
 
         # Power-ups
         self.power_ups = []
@@ -84,6 +135,7 @@ class Game:
 
         # Boss system
         self.active_boss = None
+        self._boss_acc = 0.0
         self.boss_waves = {
             3: BossCharger,
             6: BossSummoner,
@@ -91,6 +143,7 @@ class Game:
             12: BossSniper,
             15: BossSplitter,
         }
+        self._is_boss_wave = self.current_wave in self.boss_waves
 
     def create_map(self):
         """Cria paredes retangulares que limitam o jogador e inimigos no cenário."""
@@ -101,44 +154,59 @@ class Game:
         walls.append(pygame.Rect(SCREEN_W-20, 0, 20, SCREEN_H))
         return walls
 
+    def build_arena_surface(self):
+        """Pré-renderiza o fundo com as paredes (estáticas) numa única Surface opaca."""
+        arena = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
+        if self.background_image:
+            arena.blit(self.background_image, (0, 0))
+        else:
+            arena.fill(BLACK)
+        for wall in self.walls:
+            arena.fill(GRAY, wall)
+        return arena
+
     def update_weather_effects(self, dt: float):
-        """Anima flocos de neve e rajadas de vento com base no delta de tempo."""
-        for snowflake in self.snowflakes:
-            snowflake.update(dt)
+        """Anima as rajadas de vento; a neve avança junto com o desenho, usando o mesmo dt."""
+        self._weather_dt = dt
         self.wind_overlay.update(dt)
 
     def draw_weather_layer(self, with_wind: bool):
-        """Desenha a camada climática (neve e, opcionalmente, a névoa de vento)."""
-        for snowflake in self.snowflakes:
-            snowflake.draw(self.screen)
+        """Avança e desenha a neve numa única passada e, opcionalmente, a névoa de vento."""
+        self.snowfield.update_and_draw(self._weather_dt, self.screen)
+        self._weather_dt = 0.0
         if with_wind:
             self.wind_overlay.draw(self.screen)
 
+    def _enemy_overlap_test(self):
+        """
+        Retorna uma função rect -> bool que diz se o rect encosta (margem de 5 px) em algum inimigo.
+
+        Os rects dos inimigos já inflados em 10 px são montados uma vez por spawn, então cada
+        tentativa é um único `collidelist` em C, sem alocar nada.
+        """
+        enemy_safe_rects = [e.rect.inflate(10, 10) for e in self.enemies]
+        return lambda rect: rect.collidelist(enemy_safe_rects) != -1
+
     def spawn_enemy(self):
         """Tenta gerar um inimigo longe do jogador/paredes; retorna True se conseguir."""
         if self.active_boss is not None:
             return False
+        walls = self.walls
+        player_safe = self.player.rect.inflate(40, 40)
+        near_enemy = self._enemy_overlap_test()
+        rand = random.random
         for _ in range(20):
-            side = random.choice(['top', 'bottom', 'left', 'right'])
-            if side == 'top':
-                x = random.randint(100, SCREEN_W-100)
-                y = random.randint(50, 100)
-            elif side == 'bottom':
-                x = random.randint(100, SCREEN_W-100)
-                y = random.randint(SCREEN_H-100, SCREEN_H-50)
-            elif side == 'left':
-                x = random.randint(50, 100)
-                y = random.randint(100, SCREEN_H-100)
-            else:
-                x = random.randint(SCREEN_W-100, SCREEN_W-50)
-                y = random.randint(100, SCREEN_H-100)
+            # Lado sorteado e coordenadas inteiras uniformes a partir de random() (mais barato que choice/randint)
+            x0, x1, y0, y1 = SPAWN_EDGES[int(rand() * 4)]
+            x = x0 + int(rand() * (x1 - x0 + 1))
+            y = y0 + int(rand() * (y1 - y0 + 1))
 
             enemy_rect = pygame.Rect(x - ENEMY_SIZE//2, y - ENEMY_SIZE//2, ENEMY_SIZE, ENEMY_SIZE)
-            if any(enemy_rect.colliderect(w) for w in self.walls):
+            if enemy_rect.collidelist(walls) != -1:
                 continue
-            if enemy_rect.colliderect(self.player.rect.inflate(40, 40)):
+            if enemy_rect.colliderect(player_safe):
                 continue
-            if any(enemy_rect.colliderect(e.rect.inflate(10, 10)) for e in self.enemies):
+            if near_enemy(enemy_rect):
                 continue
 
             self.enemies.append(Enemy(x, y, self.current_wave))
@@ -148,27 +216,38 @@ class Game:
     def spawn_power_up(self):
         """Gera um power-up aleatório em local seguro longe de paredes e entidades."""
         power_type = random.choice(["health", "armor", "regen"])
+        walls = self.walls
+        player_safe = self.player.rect.inflate(20, 20)
+        near_enemy = self._enemy_overlap_test()
+        rand = random.random
+        span_x = SCREEN_W - 200 + 1
+        span_y = SCREEN_H - 200 + 1
         for _ in range(50):
-            x = random.randint(100, SCREEN_W - 100)
-            y = random.randint(100, SCREEN_H - 100)
+            x = 100 + int(rand() * span_x)
+            y = 100 + int(rand() * span_y)
             r = pygame.Rect(x - 20, y - 20, 40, 40)
-            if any(r.colliderect(w) for w in self.walls):
+            if r.collidelist(walls) != -1:
                 continue
-            if r.colliderect(self.player.rect.inflate(20, 20)):
+            if r.colliderect(player_safe):
                 continue
-            if any(r.colliderect(e.rect.inflate(10, 10)) for e in self.enemies):
+            if near_enemy(r):
                 continue
             self.power_ups.append(PowerUp(x, y, power_type))
             return
 
     def check_power_up_collision(self):
         """Verifica se o player coletou algum power-up ativo e aplica efeito."""
-        for power_up in self.power_ups[:]:
-            if not power_up.collected and self.player.rect.colliderect(power_up.rect):
+        player_rect = self.player.rect
+        remaining = []
+        for power_up in self.power_ups:
+            if not power_up.collected and player_rect.colliderect(power_up.rect):
                 self.apply_power_up(power_up)
+            if not power_up.collected:
+                remaining.append(power_up)
+        self.power_ups = remaining
 
     def apply_power_up(self, power_up):
-        """Aplica o efeito do power-up coletado e remove da lista ativa."""
+        """Aplica o efeito do power-up coletado e o marca como coletado (sai da lista ativa na varredura)."""
         if power_up.power_type == "health":
             self.player.max_hp += 25
             self.player.hp = min(self.player.max_hp, self.player.hp + 25)
@@ -177,18 +256,16 @@ class Game:
         elif power_up.power_type == "regen":
             self.player.hp = min(self.player.max_hp, self.player.hp + 10)
         power_up.collected = True
-        if self.power_up_sound:
-            self.power_up_sound.play()
-        if power_up in self.power_ups:
-            self.power_ups.remove(power_up)
+        power_up.visible = False
+        if self._power_up_channel is not None:
+            self._power_up_channel.play(self.power_up_sound)
 
     def check_upgrade_click(self, mouse_pos):
         """Detecta cliques em cartões de upgrade durante a tela de recompensa."""
-        if hasattr(self, 'upgrade_rects'):
-            for i, rect in enumerate(self.upgrade_rects):
-                if rect.collidepoint(mouse_pos):
-                    self.select_upgrade(i)
-                    return True
+        for i, rect in enumerate(self.upgrade_rects):
+            if rect.collidepoint(mouse_pos):
+                self.select_upgrade(i)
+                return True
         return False
 
     def generate_upgrades(self):
@@ -198,12 +275,56 @@ class Game:
             ("Dano", "Aumenta dano", RED),
             ("Capacidade", "Aumenta munição por pente", YELLOW),
         ]
+        self.layout_upgrades()
+
+    def layout_upgrades(self):
+        """
+        Calcula os cartões de upgrade e rasteriza seus textos uma única vez.
+
+        Preenche `upgrade_rects` (um rect por upgrade) e `_upgrade_surfs`, a sequência
+        (surface, rect) com todos os textos da tela, enviada num único `blits`.
+        """
+        self.upgrade_rects = []
+        t1 = self._rtext("WAVE CLEAR!", GREEN)
+        t2 = self._rtext("Escolha um upgrade:", WHITE)
+        surfs = [
+            (t1, t1.get_rect(center=(SCREEN_W//2, 100))),
+            (t2, t2.get_rect(center=(SCREEN_W//2, 180))),
+        ]
+        y = 250
+        for i, (name, desc, color) in enumerate(self.available_upgrades):
+            self.upgrade_rects.append(pygame.Rect(200, y - 20, SCREEN_W - 400, 80))
+            num = self._rtext(f"{i+1}", color)
+            nm = self._rtext(name, WHITE)
+            ds = self._rtext(desc, GRAY, self.small_font)
+            surfs.append((num, num.get_rect(center=(250, y + 20))))
+            surfs.append((nm, nm.get_rect(center=(SCREEN_W//2, y))))
+            surfs.append((ds, ds.get_rect(center=(SCREEN_W//2, y + 30))))
+            y += 120
+        info = self._rtext("Clique no upgrade desejado ou pressione 1, 2 ou 3", YELLOW, self.small_font)
+        surfs.append((info, info.get_rect(center=(SCREEN_W//2, y + 40))))
+        self._upgrade_surfs = surfs
+        self._hover_pos = None
+        self._hover_index = -1
+
+    def hovered_upgrade(self, mouse_pos) -> int:
+        """Índice do cartão sob o mouse (-1 se nenhum); só refaz o teste quando o mouse se move."""
+        if mouse_pos != self._hover_pos:
+            self._hover_pos = mouse_pos
+            self._hover_index = -1
+            for i, rect in enumerate(self.upgrade_rects):
+                if rect.collidepoint(mouse_pos):
+                    self._hover_index = i
+                    break
+        return self._hover_index
 
     def start_wave(self):
         """Configura contadores da próxima wave e decide se será wave de boss."""
         self.current_wave += 1
         self.active_boss = None
-        if self.current_wave in self.boss_waves:
+        # Decidido uma vez por wave; update_wave só consulta o booleano
+        self._is_boss_wave = self.current_wave in self.boss_waves
+        if self._is_boss_wave:
             self.enemies_remaining = 0
             self.spawn_timer = 0.0
         else:
@@ -220,14 +341,15 @@ class Game:
         if BossCls:
             bx, by = SCREEN_W//2, SCREEN_H//2 - 150
             self.active_boss = BossCls(bx, by)
+            self._boss_acc = 0.0
 
     def update_wave(self, dt: float):
         """Avança timers de spawn ou bosses e controla tela de upgrades ao limpar waves."""
-        if self.current_wave in self.boss_waves:
+        if self._is_boss_wave:
             if self.active_boss is None and not self.enemies:
                 self.spawn_boss()
             if self.active_boss and self.active_boss.is_dead() and not self.showing_upgrades:
-                if isinstance(self.active_boss, BossSplitter):
+                if self.active_boss.is_splitter:
                     self.game_over = True
                     return
                 
@@ -235,9 +357,9 @@ class Game:
                 self.enemies.clear()
                 
                 if self.wave_clear_time == 0:
-                    self.wave_clear_time = pygame.time.get_ticks() / 1000.0
+                    self.wave_clear_time = self.frame_time
                     self.showing_upgrades = True
-                now = pygame.time.get_ticks() / 1000.0
+                now = self.frame_time
                 if now - self.wave_clear_time >= self.wave_clear_delay:
                     self.start_wave()
                     self.wave_clear_time = 0.0
@@ -252,9 +374,9 @@ class Game:
                     self.spawn_timer = 0.0
         elif len(self.enemies) == 0 and not self.showing_upgrades:
             if self.wave_clear_time == 0:
-                self.wave_clear_time = pygame.time.get_ticks() / 1000.0
+                self.wave_clear_time = self.frame_time
                 self.showing_upgrades = True
-            now = pygame.time.get_ticks() / 1000.0
+            now = self.frame_time
             if now - self.wave_clear_time >= self.wave_clear_delay:
                 self.start_wave()
                 self.wave_clear_time = 0.0
@@ -271,8 +393,7 @@ class Game:
             elif name == "Capacidade":
                 self.player.upgrade_ammo_capacity()
             self.showing_upgrades = False
-            if hasattr(self, 'upgrade_rects'):
-                self.upgrade_rects.clear()
+            self.upgrade_rects.clear()
 
     def handle_events(self):
         """Processa eventos do pygame (teclado, mouse e fechamento da janela)."""
@@ -307,22 +428,21 @@ class Game:
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
-                    mouse_pos = pygame.mouse.get_pos()
                     if self.showing_upgrades:
-                        self.check_upgrade_click(mouse_pos)
+                        self.check_upgrade_click(event.pos)
                     elif not self.in_menu and not self.paused and not self.game_over:
                         self.shoot_bullets(pygame.time.get_ticks() / 1000.0)
 
             elif event.type == pygame.MOUSEMOTION and not self.in_menu and not self.showing_upgrades and not self.paused and not self.game_over:
-                self.player.rotate_to_mouse(pygame.mouse.get_pos())
+                self.player.rotate_to_mouse(event.pos)
 
     def shoot_bullets(self, current_time: float):
         """Solicita disparo ao player e, se houver projétil, toca som e adiciona à lista."""
         bullet = self.player.shoot(current_time)
         if bullet:
             self.bullets.append(bullet)
-            if self.gunshot_sound:
-                self.gunshot_sound.play()
+            if self._gun_channel is not None:
+                self._gun_channel.play(self.gunshot_sound)
 
     def start_game(self):
         """Reinicia estado para início de partida a partir do menu."""
@@ -331,6 +451,7 @@ class Game:
         self.paused = False
         self.showing_upgrades = False
         self.current_wave = 1
+        self._is_boss_wave = self.current_wave in self.boss_waves
         self.enemies_remaining = 3
         self.wave_clear_time = 0.0
         self.spawn_timer = 0.0
@@ -338,21 +459,25 @@ class Game:
         self.player = Player(SCREEN_W//2, SCREEN_H//2)
         self.bullets.clear()
         self.enemies.clear()
+        particles.clear()
         self.power_ups.clear()
         self.active_boss = None
         self.generate_upgrades()
 
     def update(self, dt: float):
         """Executa lógica por frame: movimentações, colisões, spawns, bosses e verificações de game over."""
+        # Relógio e mouse amostrados uma vez por frame; o restante do frame lê os valores cacheados
+        self.frame_time = current_time = pygame.time.get_ticks() / 1000.0
+        self.mouse_pos = pygame.mouse.get_pos()
+
         self.update_weather_effects(dt)
         if self.in_menu or self.paused or self.game_over or self.showing_upgrades:
             return
 
         keys = pygame.key.get_pressed()
         self.player.update(dt, keys, self.walls)
-        self.player.rotate_to_mouse(pygame.mouse.get_pos())
+        self.player.rotate_to_mouse(self.mouse_pos)
 
-        current_time = pygame.time.get_ticks() / 1000.0
         self.player.update_reload(current_time)
 
         # Power-ups
@@ -360,43 +485,63 @@ class Game:
         if self.power_up_spawn_timer >= self.power_up_spawn_rate:
             self.spawn_power_up()
             self.power_up_spawn_timer = 0.0
-        for pu in self.power_ups[:]:
-            if not pu.update(dt):
-                if pu in self.power_ups:
-                    self.power_ups.remove(pu)
+        self.power_ups = update_power_ups(self.power_ups, dt)
         self.check_power_up_collision()
 
         # Balas do player
-        for bullet in self.bullets[:]:
-            if not bullet.update(dt, self.walls):
-                self.bullets.remove(bullet)
+        self.bullets = update_bullets(self.bullets, dt, self.walls)
 
         # Inimigos comuns
-        for enemy in self.enemies[:]:
-            enemy.update(dt, self.player, self.walls)
-            enemy.attack(self.player, current_time)
-            if enemy.is_dead():
-                self.enemies.remove(enemy)
+        self.enemies = update_enemies(self.enemies, dt, self.player, self.walls, current_time)
+        particles.update(dt)
 
-        # Boss
+        # Boss (passo fixo com acumulador: timers e investidas não dependem do FPS)
         if self.active_boss is not None:
-            self.active_boss.update(dt, self)
-
-        # Colisão bala-inimigo/boss
+            self._boss_acc += dt
+            ticks = 0
+            while self._boss_acc >= BOSS_TICK and ticks < BOSS_MAX_TICKS:
+                self.active_boss.update(BOSS_TICK, self)
+                self._boss_acc -= BOSS_TICK
+                ticks += 1
+            if self._boss_acc >= BOSS_TICK:
+                self._boss_acc = 0.0
+
+        # Colisão bala-inimigo/boss (com muitos inimigos, broad-phase pela grade espacial)
         if self.bullets and (self.enemies or self.active_boss):
-            for bullet in self.bullets[:]:
-                hit = False
-                for enemy in self.enemies[:]:
-                    if bullet.rect.colliderect(enemy.rect):
-                        enemy.take_damage(bullet.damage, bullet.angle)
-                        hit = True
-                        break
-                if not hit and self.active_boss is not None:
-                    if bullet.rect.colliderect(self.active_boss.rect):
-                        self.active_boss.take_damage(bullet.damage, bullet.angle)
-                        hit = True
-                if hit and bullet in self.bullets:
-                    self.bullets.remove(bullet)
+            enemies = self.enemies
+            # Lista de rects reaproveitada entre frames (sem alocar uma nova por frame)
+            enemy_rects = self._enemy_rects
+            enemy_rects.clear()
+            enemy_rects.extend(map(_rect_of, enemies))
+            use_grid = len(enemies) >= BRUTE_FORCE_LIMIT
+            if use_grid:
+                self.enemy_grid.rebuild(enemy_rects)
+                grid_hit = self.enemy_grid.first_collision
+            # Pré-teste barato contra o boss: distância ao quadrado até o centro vs. raio envolvente
+            boss = self.active_boss
+            if boss is not None:
+                boss_rect = boss.rect
+                boss_cx, boss_cy = boss_rect.center
+                reach = self.player.bullet_size + 2  # margem para o arredondamento dos centros
+                boss_r2 = ((boss_rect.width + reach) / 2) ** 2 + ((boss_rect.height + reach) / 2) ** 2
+            # Compactação in-place: balas que não acertaram são movidas para a frente da lista
+            bullets = self.bullets
+            kept = 0
+            for bullet in bullets:
+                rect = bullet.rect
+                idx = grid_hit(rect) if use_grid else rect.collidelist(enemy_rects)
+                if idx != -1:
+                    enemies[idx].take_damage(bullet.damage, bullet.angle)
+                    continue
+                if boss is not None:
+                    dx = bullet.ix - boss_cx
+                    dy = bullet.iy - boss_cy
+                    if dx*dx + dy*dy <= boss_r2 and rect.colliderect(boss_rect):
+                        boss.take_damage(bullet.damage, bullet.angle)
+                        continue
+                bullets[kept] = bullet
+                kept += 1
+            del bullets[kept:]
 
         # Dano de contato do boss
         if self.active_boss is not None and self.player.rect.colliderect(self.active_boss.rect):
@@ -409,6 +554,28 @@ class Game:
         # Waves
         self.update_wave(dt)
 
+    def _rtext(self, text: str, color, font=None) -> pygame.Surface:
+        """
+        Renderiza `text` com cache LRU: o mesmo (texto, cor, fonte) reaproveita a Surface já rasterizada.
+
+        Args:
+            text (str): texto a renderizar.
+            color (tuple[int, int, int]): cor do texto.
+            font (pygame.font.Font|None): fonte usada (padrão: `self.font`).
+        """
+        font = font or self.font
+        key = (text, color, id(font))
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            cache[key] = surface
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+
     def draw_menu(self):
         """Renderiza tela inicial com imagem ou fallback e aplica camada climática."""
         if self.menu_image:
@@ -416,52 +583,25 @@ class Game:
         else:
             self.screen.fill(BLACK)
         self.draw_weather_layer(with_wind=False)
-        if not self.menu_image:
-            title = self.font.render("BULLET ECHO", True, BLUE)
-            self.screen.blit(title, title.get_rect(center=(SCREEN_W//2, 200)))
-            sub = self.small_font.render("Pressione ESPAÇO para começar", True, WHITE)
-            self.screen.blit(sub, sub.get_rect(center=(SCREEN_W//2, 300)))
+        if self._menu_fallback:
+            self.screen.blits(self._menu_fallback, doreturn=False)
+
     def draw_upgrades(self):
         """Mostra a tela de escolha de upgrades com destaque para hover/mouse."""
-        self.screen.fill(BLACK)
-        t1 = self.font.render("WAVE CLEAR!", True, GREEN)
-        self.screen.blit(t1, t1.get_rect(center=(SCREEN_W//2, 100)))
-        t2 = self.font.render("Escolha um upgrade:", True, WHITE)
-        self.screen.blit(t2, t2.get_rect(center=(SCREEN_W//2, 180)))
-
-        # Só recalcula upgrade_rects se não existir ou se o número de upgrades mudou
-        if not hasattr(self, 'upgrade_rects') or len(self.upgrade_rects) != len(self.available_upgrades):
-            self.upgrade_rects = []
-            y = 250
-            for _ in self.available_upgrades:
-                rect = pygame.Rect(200, y - 20, SCREEN_W - 400, 80)
-                self.upgrade_rects.append(rect)
-                y += 120
-
-        mouse_pos = pygame.mouse.get_pos()
-        y = 250
-        for i, (name, desc, color) in enumerate(self.available_upgrades):
+        # select_upgrade esvazia os cartões; refaz o layout na próxima vez que a tela abrir
+        if len(self.upgrade_rects) != len(self.available_upgrades):
+            self.layout_upgrades()
+
+        screen = self.screen
+        screen.fill(BLACK)
+        hovered = self.hovered_upgrade(self.mouse_pos)
+        for i, (_, _, color) in enumerate(self.available_upgrades):
             rect = self.upgrade_rects[i]
-            if rect.collidepoint(mouse_pos):
-                pygame.draw.rect(self.screen, WHITE, rect, 5)
-                pygame.draw.rect(self.screen, color, rect, 3)
-            else:
-                pygame.draw.rect(self.screen, color, rect, 3)
-            pygame.draw.rect(self.screen, DARK_GRAY, rect)
-
-            num = self.font.render(f"{i+1}", True, color)
-            self.screen.blit(num, num.get_rect(center=(250, y + 20)))
-
-            nm = self.font.render(name, True, WHITE)
-            self.screen.blit(nm, nm.get_rect(center=(SCREEN_W//2, y)))
-
-            ds = self.small_font.render(desc, True, GRAY)
-            self.screen.blit(ds, ds.get_rect(center=(SCREEN_W//2, y + 30)))
-            y += 120
-
-        info = self.small_font.render("Clique no upgrade desejado ou pressione 1, 2 ou 3", True, YELLOW)
-        self.screen.blit(info, info.get_rect(center=(SCREEN_W//2, y + 40)))
-        self.screen.blit(info, info.get_rect(center=(SCREEN_W//2, y + 40)))
+            if i == hovered:
+                pygame.draw.rect(screen, WHITE, rect, 5)
+            pygame.draw.rect(screen, color, rect, 3)
+            pygame.draw.rect(screen, DARK_GRAY, rect)
+        screen.blits(self._upgrade_surfs, doreturn=False)
 
     def draw_boss_healthbar(self):
         """Desenha barra de vida do boss ativo na parte superior da tela."""
@@ -475,29 +615,33 @@ class Game:
         pygame.draw.rect(self.screen, DARK_GRAY, (x, y, bar_w, bar_h))
         frac = max(0.0, self.active_boss.hp / self.active_boss.max_hp)
         pygame.draw.rect(self.screen, RED, (x, y, int(bar_w * frac), bar_h))
-        name = self.small_font.render(f"Boss HP: {int(self.active_boss.hp)}/{self.active_boss.max_hp}", True, WHITE)
+        name = self._rtext(f"Boss HP: {int(self.active_boss.hp)}/{self.active_boss.max_hp}", WHITE, self.small_font)
         self.screen.blit(name, (x, y - 18))
 
     def draw(self):
         """Renderiza a cena dependendo do estado atual (menu, upgrades ou gameplay)."""
+        if self.showing_upgrades and not self.in_menu:
+            # Tela de upgrades é estática: só redesenha (e apresenta) quando o mouse mexe
+            if self._static_frame_key == self.mouse_pos:
+                return
+            self._static_frame_key = self.mouse_pos
+            self.draw_upgrades()
+            pygame.display.flip()
+            return
+        self._static_frame_key = None
+
         if self.in_menu:
             self.draw_menu()
-        elif self.showing_upgrades:
-            self.draw_upgrades()
         else:
-            # Desenha o fundo
-            if self.background_image:
-                self.screen.blit(self.background_image, (0, 0))
-            else:
-                self.screen.fill(BLACK)
-            for wall in self.walls:
-                pygame.draw.rect(self.screen, GRAY, wall)
-            for enemy in self.enemies:
-                enemy.draw(self.screen)
-            for power_up in self.power_ups:
-                power_up.draw(self.screen)
-            for bullet in self.bullets:
-                bullet.draw(self.screen)
+            # Fundo + paredes, já compostos
+            self.screen.blit(self.arena_surface, (0, 0))
+            # Partículas, inimigos, power-ups e balas vão num único lote de blits
+            batch = self.render_batch
+            particles.draw(batch)
+            draw_enemies(batch, self.enemies)
+            draw_power_ups(batch, self.power_ups)
+            draw_bullets(batch, self.bullets)
+            batch.flush(self.screen)
             if self.active_boss is not None:
                 self.active_boss.draw(self.screen)
             self.player.draw(self.screen)
@@ -509,13 +653,13 @@ class Game:
     def draw_ui(self):
         """Atualiza HUD com wave, HP, armadura, munição e mensagens contextuais."""
         # Wave - em cima no meio
-        wave_text = self.font.render(f"Wave: {self.current_wave}", True, WHITE)
+        wave_text = self._rtext(f"Wave: {self.current_wave}", WHITE)
         wave_rect = wave_text.get_rect(center=(SCREEN_W//2, 30))
         self.screen.blit(wave_text, wave_rect)
 
         # Vida - embaixo no meio
         hp_text = f"HP: {self.player.hp}/{self.player.max_hp}"
-        hp_surface = self.font.render(hp_text, True, WHITE)
+        hp_surface = self._rtext(hp_text, WHITE)
         hp_rect = hp_surface.get_rect(center=(SCREEN_W//2, SCREEN_H - 80))
         self.screen.blit(hp_surface, hp_rect)
 
@@ -530,17 +674,17 @@ class Game:
 
         # Armadura - esquerda embaixo
         armor_text = f"ARMADURA: {self.player.armor}"
-        armor_surface = self.font.render(armor_text, True, BLUE)
+        armor_surface = self._rtext(armor_text, BLUE)
         self.screen.blit(armor_surface, (20, SCREEN_H - 50))
 
         # Munição - embaixo do lado direito
         ammo_color = WHITE if not self.player.is_reloading else YELLOW
         ammo_text = f"Munição: {self.player.current_ammo}/{self.player.max_ammo}"
         if self.player.is_reloading:
-            now = pygame.time.get_ticks() / 1000.0
+            now = self.frame_time
             remaining = max(0.0, self.player.reload_time - (now - self.player.reload_start))
             ammo_text += f" (Recarregando: {remaining:.1f}s)"
-        ammo_surface = self.font.render(ammo_text, True, ammo_color)
+        ammo_surface = self._rtext(ammo_text, ammo_color)
         ammo_rect = ammo_surface.get_rect()
         ammo_rect.right = SCREEN_W - 20
         ammo_rect.bottom = SCREEN_H - 20
@@ -548,12 +692,12 @@ class Game:
 
         # Mensagens
         if self.game_over:
-            go = self.font.render("GAME OVER", True, RED)
-            rs = self.small_font.render("Pressione R para reiniciar", True, WHITE)
+            go = self._rtext("GAME OVER", RED)
+            rs = self._rtext("Pressione R para reiniciar", WHITE, self.small_font)
             self.screen.blit(go, go.get_rect(center=(SCREEN_W//2, SCREEN_H//2 - 40)))
             self.screen.blit(rs, rs.get_rect(center=(SCREEN_W//2, SCREEN_H//2)))
         elif self.paused:
-            p = self.font.render("PAUSADO", True, YELLOW)
+            p = self._rtext("PAUSADO", YELLOW)
             self.screen.blit(p, p.get_rect(center=(SCREEN_W//2, SCREEN_H//2)))
 
     def restart_game(self):
@@ -561,9 +705,11 @@ class Game:
         self.player = Player(SCREEN_W//2, SCREEN_H//2)
         self.bullets.clear()
         self.enemies.clear()
+        particles.clear()
         self.power_ups.clear()
         self.active_boss = None
         self.current_wave = 1
+        self._is_boss_wave = self.current_wave in self.boss_waves
         self.enemies_remaining = 3
         self.wave_clear_time = 0.0
         self.spawn_timer = 0.0
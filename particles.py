@@ -0,0 +1,109 @@
+"""
+Módulo de partículas (faíscas de impacto e explosões de morte).
+
+Classes:
+- ParticleSystem: guarda todas as partículas do jogo em listas paralelas
+  (x, y, vx, vy, vida, sprite) e as atualiza/desenha uma vez por frame.
+
+Instância global:
+- particles: sistema compartilhado usado por `Enemy` e atualizado/desenhado pelo `Game`.
+"""
+
+import pygame
+
+_sprite_cache = {}
+
+
+def _particle_sprite(radius: int, color) -> pygame.Surface:
+    """
+    Retorna (e cacheia) o círculo pré-renderizado de uma partícula.
+
+    Args:
+        radius (int): raio em pixels (mínimo 1).
+        color (tuple[int, int, int]): cor RGB.
+
+    Returns:
+        pygame.Surface: superfície SRCALPHA de lado 2*radius (compartilhada).
+    """
+    key = (radius, color)
+    surface = _sprite_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        _sprite_cache[key] = surface
+    return surface
+
+
+class ParticleSystem:
+    """Partículas em listas paralelas (uma posição por partícula em cada lista)."""
+
+    def __init__(self):
+        """Cria o sistema sem partículas."""
+        self.clear()
+
+    def clear(self):
+        """Remove todas as partículas (início/reinício de partida)."""
+        self.x = []
+        self.y = []
+        self.vx = []
+        self.vy = []
+        self.life = []
+        self.radius = []
+        self.image = []
+
+    def spawn(self, x: float, y: float, radius: int, life: float, color, vx: float = 0.0, vy: float = 0.0):
+        """
+        Adiciona uma partícula.
+
+        Args:
+            x, y (float): posição inicial.
+            radius (int): raio do círculo.
+            life (float): tempo de vida em segundos.
+            color (tuple[int, int, int]): cor RGB.
+            vx, vy (float): velocidade (px/s); partículas paradas usam 0.
+        """
+        r = max(1, int(radius))
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.life.append(life)
+        self.radius.append(r)
+        self.image.append(_particle_sprite(r, color))
+
+    def update(self, dt: float):
+        """
+        Avança todas as partículas pelo dt real e descarta as expiradas numa única passada.
+
+        Args:
+            dt (float): delta de tempo.
+        """
+        if not self.life:
+            return
+        xs, ys, vxs, vys, lives, radii, images = [], [], [], [], [], [], []
+        for x, y, vx, vy, life, r, img in zip(self.x, self.y, self.vx, self.vy, self.life, self.radius, self.image):
+            life -= dt
+            if life > 0:
+                xs.append(x + vx * dt)
+                ys.append(y + vy * dt)
+                vxs.append(vx)
+                vys.append(vy)
+                lives.append(life)
+                radii.append(r)
+                images.append(img)
+        self.x, self.y, self.vx, self.vy = xs, ys, vxs, vys
+        self.life, self.radius, self.image = lives, radii, images
+
+    def draw(self, screen):
+        """
+        Desenha todas as partículas com um único `Surface.blits`.
+
+        Args:
+            screen (pygame.Surface | RenderBatch): superfície (ou lote) de destino.
+        """
+        if self.life:
+            screen.blits([(img, (int(x) - r, int(y) - r))
+                          for img, x, y, r in zip(self.image, self.x, self.y, self.radius)], doreturn=False)
+
+
+particles = ParticleSystem()
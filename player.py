@@ -15,13 +15,32 @@ Depende de:
 """
 
 import pygame
-import math
+from math import atan2 as _atan2, cos as _cos, sin as _sin, degrees as _degrees
 from constants import *
 
+# Teclas de movimento vinculadas uma vez, sem buscar o atributo em `pygame` a cada frame
+_K_W, _K_S, _K_A, _K_D = pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d
+
+
+def _move_dir(mask: int):
+    """Direção (dx, dy) para a máscara d | a<<1 | s<<2 | w<<3; teclas opostas se anulam e diagonais são normalizadas."""
+    dx = (mask & 1) - (mask >> 1 & 1)
+    dy = (mask >> 2 & 1) - (mask >> 3 & 1)
+    if dx != 0 and dy != 0:
+        return dx * 0.707, dy * 0.707
+    return float(dx), float(dy)
+
+
+# As 16 combinações de WASD já decodificadas
+_MOVE_LUT = tuple(_move_dir(mask) for mask in range(16))
+
 
 class Player:
     """Classe que representa o jogador, controlando movimento, combate e upgrades."""
 
+    # Sprite pré-girado para cada grau inteiro (0..359), compartilhado entre instâncias
+    _rotations = None
+
     def __init__(self, x: float, y: float):
         """
         Inicializa o jogador na posição (x, y) e carrega seus parâmetros iniciais.
@@ -32,6 +51,11 @@ class Player:
         self.x = x
         self.y = y
         self.angle = 0
+        # Trigonometria da mira, recalculada só quando o ângulo muda (rotate_to_mouse)
+        self._cos = 1.0
+        self._sin = 0.0
+        self._angle_deg = 0
+        self._aim_offset = None  # (dx, dy) até o mouse na última mira calculada
         self.hp = PLAYER_HP
         self.max_hp = PLAYER_HP
         self.rect = pygame.Rect(int(x - PLAYER_SIZE//2), int(y - PLAYER_SIZE//2), PLAYER_SIZE, PLAYER_SIZE)
@@ -66,6 +90,9 @@ class Player:
         self.image_available = True
         original = pygame.image.load("bolinha.png").convert_alpha()
         self.original_image = pygame.transform.smoothscale(original, (PLAYER_SIZE, PLAYER_SIZE))
+        if Player._rotations is None:
+            # Custo único na primeira partida; o draw passa a só indexar a tabela
+            Player._rotations = [pygame.transform.rotozoom(self.original_image, a, 1) for a in range(360)]
 
     def _candidate_rect(self, dx: float, dy: float) -> pygame.Rect:
         """
@@ -77,10 +104,9 @@ class Player:
         Returns:
             pygame.Rect: rect ajustado para verificar colisão antes do movimento real.
         """
-        cand = self.rect.copy()
-        cand.centerx = int(self.x + dx)
-        cand.centery = int(self.y + dy)
-        return cand
+        # Um único Rect.move, com o mesmo arredondamento de posicionar o centro em int(x + dx)
+        rect = self.rect
+        return rect.move(int(self.x + dx) - rect.centerx, int(self.y + dy) - rect.centery)
 
     def apply_impulse(self, ix: float, iy: float):
         """
@@ -99,26 +125,36 @@ class Player:
         Args:
             walls (list[pygame.Rect]): lista de paredes.
         """
-        for w in walls:
-            if self.rect.colliderect(w):
-                left_overlap = self.rect.right - w.left
-                right_overlap = w.right - self.rect.left
-                top_overlap = self.rect.bottom - w.top
-                bottom_overlap = w.bottom - self.rect.top
-
-                min_overlap = min(left_overlap, right_overlap, top_overlap, bottom_overlap)
-
-                if min_overlap == left_overlap:
-                    self.rect.right = w.left
-                elif min_overlap == right_overlap:
-                    self.rect.left = w.right
-                elif min_overlap == top_overlap:
-                    self.rect.bottom = w.top
+        hits = self.rect.collidelistall(walls)
+        if not hits:
+            return
+        # Só as paredes tocadas (normalmente uma) passam pelo laço em Python; o teste é
+        # refeito porque cada correção anterior pode já ter tirado o rect de dentro da próxima
+        rect = self.rect
+        for i in hits:
+            w = walls[i]
+            if not rect.colliderect(w):
+                continue
+            left_overlap = rect.right - w.left
+            right_overlap = w.right - rect.left
+            top_overlap = rect.bottom - w.top
+            bottom_overlap = w.bottom - rect.top
+
+            # Empurra pelo eixo de menor penetração (empates: esquerda, direita, cima, baixo)
+            h_overlap = left_overlap if left_overlap <= right_overlap else right_overlap
+            v_overlap = top_overlap if top_overlap <= bottom_overlap else bottom_overlap
+            if h_overlap <= v_overlap:
+                if left_overlap <= right_overlap:
+                    rect.right = w.left
                 else:
-                    self.rect.top = w.bottom
+                    rect.left = w.right
+            elif top_overlap <= bottom_overlap:
+                rect.bottom = w.top
+            else:
+                rect.top = w.bottom
 
-                self.x = float(self.rect.centerx)
-                self.y = float(self.rect.centery)
+        self.x = float(rect.centerx)
+        self.y = float(rect.centery)
 
     def update(self, dt: float, keys, walls):
         """
@@ -129,16 +165,8 @@ class Player:
             keys: estado das teclas (pygame.key.get_pressed()).
             walls (list[pygame.Rect]): obstáculos.
         """
-        dx, dy = 0.0, 0.0
-        if keys[pygame.K_w]: dy -= 1
-        if keys[pygame.K_s]: dy += 1
-        if keys[pygame.K_a]: dx -= 1
-        if keys[pygame.K_d]: dx += 1
-
-        # Normaliza a velocidade em diagonais
-        if dx != 0 and dy != 0:
-            dx *= 0.707
-            dy *= 0.707
+        # WASD -> (dx, dy) por tabela, já com diagonais normalizadas
+        dx, dy = _MOVE_LUT[keys[_K_D] | keys[_K_A] << 1 | keys[_K_S] << 2 | keys[_K_W] << 3]
 
         # Movimento base + impulso
         move_x = dx * self.speed * dt + self.impulse_x * dt
@@ -151,14 +179,14 @@ class Player:
         # Movimento eixo X
         if move_x != 0:
             cand = self._candidate_rect(move_x, 0)
-            if not any(cand.colliderect(w) for w in walls):
+            if cand.collidelist(walls) == -1:
                 self.x += move_x
                 self.rect.centerx = int(self.x)
 
         # Movimento eixo Y
         if move_y != 0:
             cand = self._candidate_rect(0, move_y)
-            if not any(cand.colliderect(w) for w in walls):
+            if cand.collidelist(walls) == -1:
                 self.y += move_y
                 self.rect.centery = int(self.y)
 
@@ -175,7 +203,18 @@ class Player:
         """
         dx = mouse_pos[0] - self.x
         dy = mouse_pos[1] - self.y
-        self.angle = math.atan2(dy, dx)
+        # Mouse e jogador parados (caso comum: chamado no MOUSEMOTION e de novo no update) -> nada muda
+        offset = (dx, dy)
+        if offset == self._aim_offset:
+            return
+        self._aim_offset = offset
+        angle = _atan2(dy, dx)
+        if angle != self.angle:
+            self.angle = angle
+            self._cos = _cos(angle)
+            self._sin = _sin(angle)
+            # Rotação do sprite em graus inteiros: índice na tabela pré-girada
+            self._angle_deg = round(-_degrees(angle))
 
     def shoot(self, current_time: float):
         """
@@ -273,7 +312,7 @@ class Player:
         - Linha representando o cano da arma.
         """
         if self.image_available and self.original_image is not None:
-            rotated_image = pygame.transform.rotate(self.original_image, -math.degrees(self.angle))
+            rotated_image = self._rotations[self._angle_deg % 360]
             rect = rotated_image.get_rect(center=(int(self.x), int(self.y)))
             screen.blit(rotated_image, rect)
         else:
@@ -281,6 +320,6 @@ class Player:
 
         # Arma (linha apontando na direção do mouse)
         gun_length = 25
-        gun_x = self.x + math.cos(self.angle) * (PLAYER_SIZE//2 + 5)
-        gun_y = self.y + math.sin(self.angle) * (PLAYER_SIZE//2 + 5)
+        gun_x = self.x + self._cos * (PLAYER_SIZE//2 + 5)
+        gun_y = self.y + self._sin * (PLAYER_SIZE//2 + 5)
         pygame.draw.line(screen, DARK_GRAY, (self.x, self.y), (gun_x, gun_y), 3)
\ No newline at end of file
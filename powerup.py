@@ -2,31 +2,92 @@
 Módulo PowerUp — gerencia os itens coletáveis do jogo (vida, armadura e regeneração).
 
 Responsabilidades:
-- Carregar e cachear imagens dos power-ups.
-- Controlar o tempo de vida (desaparecem após alguns segundos).
-- Detectar coleta pelo jogador.
-- Desenhar o ícone visual correspondente (com efeito de piscar antes de sumir).
+- Carregar e cachear imagens dos power-ups (pré-carregadas por `PowerUp.preload()`).
+- update_all: controlar o tempo de vida (desaparecem após alguns segundos) e o
+  efeito de piscar antes de sumir, para todos os itens numa passada.
+- draw_all: desenhar os ícones visíveis num único `blits`, como em bullets/enemy.
 
 Depende de:
-- constants.py (POWER_UP_IMAGE_FILES, cores, tamanhos).
+- constants.py (POWER_UP_IMAGE_FILES, POWER_UP_SIZE, cores).
+- sprite_cache (carregamento compartilhado de sprites).
 - pygame (para imagens, colisão e desenho).
 """
 
 import pygame
 from constants import *
+import sprite_cache
+
+BLINK_TIME = 3.0  # segundos finais em que o item pisca
+
+
+def update_all(power_ups, dt: float):
+    """
+    Avança o tempo de vida de todos os power-ups numa única passada e devolve os ativos.
+
+    Itens coletados ou com o tempo esgotado saem da lista; nos últimos `BLINK_TIME`
+    segundos, `visible` alterna a cada décimo de segundo (efeito de piscar).
+
+    Args:
+        power_ups (list[PowerUp]): itens no mapa.
+        dt (float): delta de tempo.
+
+    Returns:
+        list[PowerUp]: itens não coletados e ainda dentro do tempo de vida.
+    """
+    alive = []
+    keep = alive.append
+    for pu in power_ups:
+        if pu.collected:
+            continue
+        time_left = pu.time_left - dt
+        pu.time_left = time_left
+        if time_left > 0:
+            # Pisca nos últimos segundos (visível 50% do tempo); decidido aqui, não no draw
+            pu.visible = time_left > BLINK_TIME or int(time_left * 10) % 2 == 1
+            keep(pu)
+    return alive
+
+
+def draw_all(screen, power_ups):
+    """
+    Desenha os power-ups visíveis neste frame com um único `Surface.blits`.
+
+    Args:
+        screen (pygame.Surface | RenderBatch): superfície (ou lote) de destino.
+        power_ups (Iterable[PowerUp]): itens com `visible`, `image` e `blit_pos` já calculados.
+    """
+    screen.blits(
+        [(pu.image, pu.blit_pos) for pu in power_ups if pu.visible and pu.image is not None],
+        doreturn=False,
+    )
 
 
 class PowerUp:
     """Classe que representa um power-up (item coletável) no jogo."""
 
-    _image_cache = {}
+    __slots__ = (
+        'x', 'y', 'power_type', 'size', 'rect', 'collected',
+        'lifetime', 'time_left', 'visible', 'image', 'blit_pos',
+    )
+
+    _image_cache = {}  # (power_type, size) -> Surface | None
+
+    @classmethod
+    def preload(cls, size: int = POWER_UP_SIZE):
+        """
+        Carrega as imagens de todos os tipos de power-up (chamar após `pygame.display.set_mode`).
+
+        Evita leitura de disco e redimensionamento no meio da partida, no primeiro spawn de cada tipo.
+        """
+        for power_type in POWER_UP_IMAGE_FILES:
+            cls._load_image(power_type, size)
 
     @classmethod
     def _load_image(cls, power_type: str, size: int):
         """
         Carrega e redimensiona a imagem do power-up correspondente ao tipo.
 
-        Implementa cache interno para evitar múltiplos loads do mesmo arquivo.
+        Implementa cache interno por (tipo, tamanho) para evitar múltiplos loads do mesmo arquivo.
 
         Args:
             power_type (str): tipo do power-up ("health", "armor", "regen").
@@ -35,17 +96,14 @@ class PowerUp:
         Returns:
             pygame.Surface | None: imagem carregada, ou None se não existir arquivo.
         """
-        if power_type in cls._image_cache:
-            return cls._image_cache[power_type]
+        key = (power_type, size)
+        cache = cls._image_cache
+        if key in cache:
+            return cache[key]
 
         file_name = POWER_UP_IMAGE_FILES.get(power_type)
-        if not file_name:
-            cls._image_cache[power_type] = None
-            return None
-
-        loaded = pygame.image.load(file_name).convert_alpha()
-        image = pygame.transform.smoothscale(loaded, (size, size))
-        cls._image_cache[power_type] = image
+        image = sprite_cache.get(file_name, size) if file_name else None
+        cache[key] = image
         return image
 
     def __init__(self, x: float, y: float, power_type: str, lifetime: float = 12.0):
@@ -60,46 +118,15 @@ class PowerUp:
         self.x = x
         self.y = y
         self.power_type = power_type
-        self.size = 28
+        self.size = POWER_UP_SIZE
         self.rect = pygame.Rect(int(x - self.size // 2), int(y - self.size // 2), self.size, self.size)
         self.collected = False
 
         self.lifetime = lifetime
         self.time_left = lifetime
+        self.visible = True  # falso nos frames "apagados" do piscar ou após a coleta
 
         # Carrega imagem (com cache global)
         self.image = self._load_image(power_type, self.size)
-
-    def update(self, dt: float) -> bool:
-        """
-        Atualiza o tempo de vida do item.
-
-        Args:
-            dt (float): delta de tempo desde o último frame.
-
-        Returns:
-            bool: True se o item ainda está ativo; False se expirou ou foi coletado.
-        """
-        if self.collected:
-            return False
-        self.time_left -= dt
-        return self.time_left > 0
-
-    def draw(self, screen):
-        """
-        Desenha o item na tela, aplicando efeito de piscar nos últimos 3 segundos.
-
-        Args:
-            screen (pygame.Surface): superfície onde o item será desenhado.
-        """
-        if self.collected:
-            return
-
-        # Pisca nos últimos 3 segundos (visível 50% do tempo)
-        blinking = self.time_left <= 3.0 and (int(self.time_left * 10) % 2 == 0)
-        if blinking:
-            return
-
-        if self.image:
-            rect = self.image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.image, rect)
\ No newline at end of file
+        # O item não se move: o canto do blit é calculado uma única vez
+        self.blit_pos = self.image.get_rect(center=(int(x), int(y))).topleft if self.image else None
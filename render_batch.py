@@ -0,0 +1,60 @@
+"""
+Módulo de renderização em lote.
+
+Classes:
+- RenderBatch: acumula os blits e preenchimentos de um frame e os envia à tela
+  em `flush`, na ordem em que foram enfileirados; blits consecutivos viram um
+  único `Surface.blits`.
+
+Observação: `RenderBatch` expõe `blit`, `blits` e `fill` com a mesma assinatura de
+`pygame.Surface`, então as rotinas de desenho existentes (`draw_all`...) podem
+recebê-lo no lugar da tela sem alterações.
+"""
+
+import pygame
+
+
+class RenderBatch:
+    """Fila de desenho de um frame: sprites e preenchimentos na ordem de chegada."""
+
+    def __init__(self):
+        """Cria o lote vazio."""
+        self.sprites = []  # blits pendentes desde o último fill
+        self._steps = []  # passos fechados: (sprites, None) ou (None, args do fill)
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags=0):
+        """Enfileira um blit (mesma assinatura de `Surface.blit`)."""
+        if area is None and not special_flags:
+            self.sprites.append((source, dest))
+        else:
+            self.sprites.append((source, dest, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=True):
+        """Enfileira vários blits (mesma assinatura de `Surface.blits`); não retorna rects."""
+        self.sprites.extend(blit_sequence)
+
+    def fill(self, color, rect=None, special_flags=0):
+        """Enfileira um preenchimento depois dos blits já enfileirados (barras de HP etc.)."""
+        if self.sprites:
+            self._steps.append((self.sprites, None))
+            self.sprites = []
+        self._steps.append((None, (color, rect, special_flags)))
+
+    def flush(self, screen: pygame.Surface):
+        """
+        Desenha tudo o que foi enfileirado, na ordem de chegada, e esvazia o lote.
+
+        Args:
+            screen (pygame.Surface): superfície de destino.
+        """
+        blits = screen.blits
+        fill = screen.fill
+        for sprites, fill_args in self._steps:
+            if sprites is not None:
+                blits(sprites, doreturn=False)
+            else:
+                fill(*fill_args)
+        self._steps.clear()
+        if self.sprites:
+            blits(self.sprites, doreturn=False)
+            self.sprites.clear()
@@ -3,50 +3,86 @@
 Efeitos climáticos utilizados nas telas do jogo.
 
 O módulo define:
-- Snowflake: partículas individuais que caem com leve deslocamento de vento.
-- WindOverlay: névoa translúcida composta por rajadas horizontais.
+- SnowField: conjunto de flocos de neve (listas paralelas) que caem com leve deslocamento de vento.
+- WindOverlay: névoa translúcida composta por rajadas horizontais (listas paralelas).
 """
 
-import math
 import random
+from math import sin as _sin, tau as _tau
 import pygame
 from constants import SCREEN_W, SCREEN_H
 
-class Snowflake:
-    """Representa um floco de neve que cai com leve efeito de vento."""
-    def __init__(self):
-        self.x = random.uniform(0, SCREEN_W)
-        self.y = random.uniform(-SCREEN_H, 0)
-        self.size = random.randint(2, 5)
-        self.speed = random.uniform(40, 120)
-        self.wind = random.uniform(-20, 20)  # deslocamento horizontal leve
+# Tabela de seno para o balanço das rajadas: 4096 amostras de uma volta (erro < 0,05 px)
+_SIN_LUT_MASK = 4095
+_SIN_LUT_SCALE = (_SIN_LUT_MASK + 1) / _tau
+_SIN_LUT = tuple(_sin(i / _SIN_LUT_SCALE) for i in range(_SIN_LUT_MASK + 1))
 
-    def update(self, dt):
-        """Atualiza a posição com base no tempo e vento."""
-        self.y += self.speed * dt
-        self.x += self.wind * dt
-
-        # Oscilação leve (simula vento turbulento)
-        self.x += 15 * dt * random.uniform(-1, 1)
+class SnowField:
+    """Flocos de neve em listas paralelas (x, y, tamanho, velocidade, vento), atualizados e desenhados numa passada."""
+    def __init__(self, count):
+        uniform = random.uniform
+        self.x = [uniform(0, SCREEN_W) for _ in range(count)]
+        self.y = [uniform(-SCREEN_H, 0) for _ in range(count)]
+        self.size = [random.randint(2, 5) for _ in range(count)]
+        self.speed = [uniform(40, 120) for _ in range(count)]
+        self.wind = [uniform(-20, 20) for _ in range(count)]  # deslocamento horizontal leve
+        # Um sprite pré-renderizado por tamanho (2..5), compartilhado pelos flocos
+        sprites = {}
+        for size in set(self.size):
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (255, 255, 255), (size, size), size)
+            sprites[size] = sprite
+        self.sprite = [sprites[size] for size in self.size]
 
-        # reaparecer no topo quando sair da tela
-        if self.y > SCREEN_H:
-            self.y = random.uniform(-20, -5)
-            self.x = random.uniform(0, SCREEN_W)
+    def update_and_draw(self, dt, screen):
+        """Avança todos os flocos pelo tempo e vento e os desenha na mesma passada (um único `blits`)."""
+        uniform = random.uniform
+        rand = random.random
+        xs, ys = self.x, self.y
+        # Oscilação em [-15*dt, 15*dt) via random() direto, sem a chamada Python de uniform por floco
+        jitter = 15 * dt
+        jitter_span = 2 * jitter
+        blits = []
+        add = blits.append
+        for i, (speed, wind, size, sprite) in enumerate(zip(self.speed, self.wind, self.size, self.sprite)):
+            y = ys[i] + speed * dt
+            # Vento + oscilação leve (simula vento turbulento)
+            x = xs[i] + wind * dt + jitter_span * rand() - jitter
 
-    def draw(self, screen):
-        pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), self.size)
+            # reaparecer no topo quando sair da tela
+            if y > SCREEN_H:
+                y = uniform(-20, -5)
+                x = uniform(0, SCREEN_W)
+            xs[i] = x
+            ys[i] = y
+            add((sprite, (int(x) - size, int(y) - size)))
+        screen.blits(blits, doreturn=False)
 
 class WindOverlay:
-    """Névoa translúcida em movimento lateral simulando vento."""
-    def __init__(self):
-        self.surface = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        self.gusts = [self._create_gust() for _ in range(12)]
+    """Névoa translúcida em movimento lateral simulando vento, com as rajadas em listas paralelas."""
+
+    # (largura, altura, alpha base) de cada textura compartilhada: pequena/tênue até grande/densa
+    GUST_SHAPES = ((220, 50, 28), (290, 75, 43), (360, 100, 58))
+    _gust_pool = None  # uma Surface por forma, criada na primeira instância
+
+    def __init__(self, count=12):
+        uniform = random.uniform
+        if WindOverlay._gust_pool is None:
+            WindOverlay._gust_pool = [self._create_gust_surface(*shape) for shape in self.GUST_SHAPES]
+        pool = WindOverlay._gust_pool
+        self.surface = [random.choice(pool) for _ in range(count)]
+        self.width = [surface.get_width() for surface in self.surface]
+        self.half_h = [surface.get_height() // 2 for surface in self.surface]
+        self.x = [uniform(-SCREEN_W, SCREEN_W) for _ in range(count)]
+        self.base_y = [uniform(60, SCREEN_H - 60) for _ in range(count)]
+        self.top = [0.0] * count  # y do canto superior, já descontada metade da altura
+        self.speed = [uniform(60, 140) for _ in range(count)]
+        self.amplitude = [uniform(10, 30) for _ in range(count)]
+        self.sway_speed = [uniform(0.8, 1.6) for _ in range(count)]
+        self.sway_phase = [uniform(0, _tau) for _ in range(count)]
 
-    def _create_gust(self):
-        width = random.randint(220, 360)
-        height = random.randint(50, 100)
-        base_alpha = random.randint(28, 58)
+    @staticmethod
+    def _create_gust_surface(width, height, base_alpha):
         gust_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         # Desenha elipses concêntricas para um gradiente suave
         for i in range(4):
@@ -57,31 +93,26 @@ class WindOverlay:
                 (220, 230, 255, alpha),
                 (shrink, shrink, width - shrink * 2, height - shrink * 2)
             )
-        return {
-            "x": random.uniform(-SCREEN_W, SCREEN_W),
-            "base_y": random.uniform(60, SCREEN_H - 60),
-            "y": 0.0,
-            "width": width,
-            "height": height,
-            "speed": random.uniform(60, 140),
-            "amplitude": random.uniform(10, 30),
-            "sway_speed": random.uniform(0.8, 1.6),
-            "sway_phase": random.uniform(0, math.tau),
-            "surface": gust_surface,
-        }
+        return gust_surface
 
     def update(self, dt):
-        for gust in self.gusts:
-            gust["x"] += gust["speed"] * dt
-            gust["sway_phase"] += gust["sway_speed"] * dt
-            gust["y"] = gust["base_y"] + math.sin(gust["sway_phase"]) * gust["amplitude"]
-            if gust["x"] - gust["width"] > SCREEN_W:
-                gust["x"] = -gust["width"] - random.uniform(0, SCREEN_W * 0.3)
-                gust["base_y"] = random.uniform(60, SCREEN_H - 60)
-                gust["sway_phase"] = random.uniform(0, math.tau)
+        lut, mask, scale = _SIN_LUT, _SIN_LUT_MASK, _SIN_LUT_SCALE
+        uniform = random.uniform
+        xs, base_ys, tops, phases = self.x, self.base_y, self.top, self.sway_phase
+        for i, (speed, sway_speed, amplitude, width, half_h) in enumerate(
+            zip(self.speed, self.sway_speed, self.amplitude, self.width, self.half_h)
+        ):
+            x = xs[i] + speed * dt
+            phase = phases[i] + sway_speed * dt
+            if x - width > SCREEN_W:
+                x = -width - uniform(0, SCREEN_W * 0.3)
+                base_ys[i] = uniform(60, SCREEN_H - 60)
+                phase = uniform(0, _tau)
+            xs[i] = x
+            phases[i] = phase
+            # Fase sempre positiva: o & dá a volta na tabela sem módulo em float
+            tops[i] = base_ys[i] + lut[int(phase * scale) & mask] * amplitude - half_h
 
     def draw(self, screen):
-        self.surface.fill((0, 0, 0, 0))
-        for gust in self.gusts:
-            self.surface.blit(gust["surface"], (gust["x"], gust["y"] - gust["height"] // 2))
-        screen.blit(self.surface, (0, 0))
+        # Rajadas (SRCALPHA) misturadas direto na tela, sem camada intermediária de tela cheia
+        screen.blits(list(zip(self.surface, zip(self.x, self.top))), doreturn=False)
@@ -0,0 +1,77 @@
+"""
+Módulo de grade espacial (spatial hash) para colisões entre entidades móveis.
+
+Classes:
+- EntityGrid: hash dinâmico reconstruído a cada frame com os rects de entidades
+  móveis (inimigos), usado na colisão bala-inimigo e nos testes de spawn.
+
+Observação: com poucas entidades (< BRUTE_FORCE_LIMIT) quem chama usa
+`Rect.collidelist` direto, pois o custo de calcular células supera o de testar tudo em C.
+As paredes (poucas e estáticas) são testadas sempre com `Rect.collidelist`.
+"""
+
+import pygame
+
+BRUTE_FORCE_LIMIT = 32
+MIN_CELL_SIZE = 32
+
+
+def _cell_range(rect: pygame.Rect, cell: int):
+    """Retorna os intervalos de células (x0, x1, y0, y1) cobertos pelo rect."""
+    return rect.left // cell, (rect.right - 1) // cell, rect.top // cell, (rect.bottom - 1) // cell
+
+
+class EntityGrid:
+    """Hash espacial de entidades móveis: dicionário (cx, cy) -> índices em `rects`."""
+
+    def __init__(self, cell_size: int = 64):
+        """
+        Cria uma grade vazia; o dicionário é reaproveitado entre frames.
+
+        Args:
+            cell_size (int): lado de cada célula em pixels.
+        """
+        self.cell_size = max(MIN_CELL_SIZE, int(cell_size))
+        self.rects = []
+        self._cells = {}
+
+    def rebuild(self, rects):
+        """
+        Reindexa a grade com os rects do frame atual.
+
+        Args:
+            rects (list[pygame.Rect]): rects das entidades, na ordem da lista original.
+        """
+        cells = self._cells
+        cells.clear()
+        self.rects = rects
+        cell = self.cell_size
+        for i, rect in enumerate(rects):
+            x0, x1, y0, y1 = _cell_range(rect, cell)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [i]
+                    else:
+                        bucket.append(i)
+
+    def first_collision(self, rect: pygame.Rect) -> int:
+        """
+        Retorna o menor índice cujo rect colide com `rect`, ou -1 (mesmo contrato de `Rect.collidelist`).
+
+        Args:
+            rect (pygame.Rect): área consultada.
+        """
+        x0, x1, y0, y1 = _cell_range(rect, self.cell_size)
+        cells = self._cells
+        rects = self.rects
+        best = -1
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for i in bucket:
+                        if (best == -1 or i < best) and rect.colliderect(rects[i]):
+                            best = i
+        return best
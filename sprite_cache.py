@@ -0,0 +1,48 @@
+"""
+Módulo de cache de sprites compartilhado entre as entidades do jogo.
+
+Funções:
+- get(name, size): carrega o PNG, converte para o formato da tela e redimensiona
+  para (size, size) uma única vez; chamadas seguintes reaproveitam a mesma Surface.
+  Imagens sem nenhum pixel translúcido usam `convert()` (blit sem alpha por pixel).
+
+Observação: as Surfaces devolvidas são compartilhadas e não devem ser alteradas
+por quem as usa. Requer que `pygame.display.set_mode` já tenha sido chamado.
+"""
+
+import pygame
+
+_cache = {}
+
+
+def get(name: str, size: int) -> pygame.Surface:
+    """
+    Retorna o sprite `name` redimensionado para (size, size), carregando-o na primeira chamada.
+
+    Args:
+        name (str): caminho do arquivo de imagem.
+        size (int): lado do sprite em pixels.
+
+    Returns:
+        pygame.Surface: imagem convertida e redimensionada (compartilhada).
+    """
+    key = (name, size)
+    surface = _cache.get(key)
+    if surface is None:
+        loaded = pygame.image.load(name)
+        if _is_opaque(loaded):
+            # Sem transparência: formato da tela sem canal alpha usa o blit rápido
+            loaded = loaded.convert()
+        else:
+            loaded = loaded.convert_alpha()
+        surface = pygame.transform.smoothscale(loaded, (size, size))
+        _cache[key] = surface
+    return surface
+
+
+def _is_opaque(image: pygame.Surface) -> bool:
+    """Retorna True se todos os pixels da imagem têm alpha 255."""
+    if not image.get_flags() & pygame.SRCALPHA:
+        return True
+    mask = pygame.mask.from_surface(image, 254)
+    return mask.count() == image.get_width() * image.get_height()